@@ -1,7 +1,194 @@
-from .gui.window import Window
+def run(
+    enable_neat=False,
+    night_mode=False,
+    headless=False,
+    parallel=False,
+    num_workers=None,
+    turbo=False,
+    profile=False,
+    resume=False,
+    coordinator=False,
+    worker=False,
+    address=None,
+    islands=False,
+    population_size=None,
+    generations=None,
+    seed=None,
+    config_file=None
+):
+    """Run the game"""
+    import os
 
+    from .constants import (
+        AUTHKEY_FILE_NAME,
+        COORDINATOR_ADDRESS,
+        COORDINATOR_AUTHKEY,
+        GENERATIONS,
+        ISLANDS,
+        NEAT_CONFIG_FILE_NAME
+    )
 
-def run(enable_neat=False, night_mode=False):
-    """Run the game"""
-    window = Window(enable_neat=enable_neat, night_mode=night_mode)
+    address = address or COORDINATOR_ADDRESS
+    authkey = COORDINATOR_AUTHKEY
+
+    # Without a shared secret, a coordinator on a loopback address generates a random key for this run
+    # and writes it to a file that only its user (and so the workers they start) can read
+    if (worker or coordinator) and authkey is None:
+        from .libs.neat import create_authkey, is_loopback, read_authkey
+
+        if not is_loopback(address[0]):
+            print(
+                f"Set the DINOSAUR_AUTHKEY environment variable to a secret shared by the coordinator and the workers "
+                f"to use {address[0]}, which isn't a loopback address"
+            )
+            return
+
+        if coordinator:
+            authkey = create_authkey(AUTHKEY_FILE_NAME)
+        else:
+            try:
+                authkey = read_authkey(AUTHKEY_FILE_NAME)
+            except FileNotFoundError:
+                print(f"There is no key at {AUTHKEY_FILE_NAME}, start the coordinator first (python main.py train --coordinator)")
+                return
+            except PermissionError as error:
+                print(error)
+                return
+
+    # Evaluate the genomes sent by a coordinator (possibly on another machine) with one process per core
+    if worker:
+        from .event_handlers.neat import evaluate_genomes
+        from .libs.neat import run_worker
+        from multiprocessing import Process
+
+        print(f"Evaluating the genomes sent by the coordinator at {address[0]}:{address[1]}...")
+        workers = [
+            Process(target=run_worker, args=(address, authkey.encode(), evaluate_genomes))
+            for _ in range(num_workers or os.cpu_count())
+        ]
+
+        for process in workers:
+            process.start()
+
+        for process in workers:
+            process.join()
+
+        return
+
+    # The training reads every NEAT setting from the config file, except the population size if one is given
+    training = {
+        "seed": seed,
+        "generations": generations or GENERATIONS,
+        "overrides": {"pop_size": population_size} if population_size is not None else {},
+        "config_file": config_file or NEAT_CONFIG_FILE_NAME,
+        "resume": resume
+    }
+
+    # Time the phases of the game and append the timings to a file if requested
+    profiler = create_profiler() if profile else None
+
+    # The game is only imported when it runs so that importing the package stays fast
+    # and doesn't need a display
+    if headless or parallel or coordinator or islands:
+        from .event_handlers import NEATEventHandler
+
+        # Train the AI without opening a window, optionally across worker processes, machines or islands
+        game = NEATEventHandler(
+            headless=True,
+            parallel=parallel,
+            num_workers=num_workers,
+            address=address if coordinator else None,
+            authkey=authkey.encode() if coordinator else None,
+            islands=ISLANDS if islands else None,
+            **training
+        )
+        game.enable_profiling(profiler)
+
+        try:
+            game.run()
+        finally:
+            if profiler is not None:
+                profiler.dump(force=True)
+
+            # The key of the run can't be used by the workers of another one
+            if coordinator and COORDINATOR_AUTHKEY is None:
+                os.remove(AUTHKEY_FILE_NAME)
+
+        return
+
+    from .event_handlers import NEATEventHandler, PlayerEventHandler
+    from .gui.window import Window
+
+    if enable_neat:
+        window = Window(NEATEventHandler, training, night_mode=night_mode, turbo=turbo, profiler=profiler)
+    else:
+        window = Window(PlayerEventHandler, night_mode=night_mode, turbo=turbo, profiler=profiler)
+
+    window.run()
+
+
+def replay(
+    policy_file=None,
+    genome_id=None,
+    store_file=None,
+    config_file=None,
+    seed=None,
+    night_mode=False,
+    turbo=False,
+    profile=False
+):
+    """Watch the networks of a policy file (the exported winner by default) or of a stored genome play the game"""
+    from .constants import GENOME_STORE_FILE_NAME, NEAT_CONFIG_FILE_NAME, POLICY_FILE_NAME
+    from .event_handlers import ReplayEventHandler
+    from .libs.policy import Policy
+    import os
+
+    if genome_id is not None:
+        from .libs.genome_store import GenomeStore
+        from .libs.neat import BatchFeedForwardNetwork, load_config
+
+        store_file = store_file or GENOME_STORE_FILE_NAME
+
+        if not os.path.exists(store_file):
+            print(f"There is no genome store at {store_file}, train the AI first (python main.py train)")
+            return
+
+        store = GenomeStore(store_file)
+
+        try:
+            genome = store.load(genome_id)
+        except KeyError:
+            print(f"There is no genome with the ID {genome_id} in {store_file}")
+            return
+        finally:
+            store.close()
+
+        policy = BatchFeedForwardNetwork.create([genome], load_config(config_file=config_file or NEAT_CONFIG_FILE_NAME))
+    else:
+        policy_file = policy_file or POLICY_FILE_NAME
+
+        if not os.path.exists(policy_file):
+            print(f"There is no policy file at {policy_file}, train the AI first (python main.py train)")
+            return
+
+        policy = Policy.load(policy_file)
+
+    from .gui.window import Window
+
+    profiler = create_profiler() if profile else None
+    window = Window(
+        ReplayEventHandler,
+        {"policy": policy, "seed": seed},
+        night_mode=night_mode,
+        turbo=turbo,
+        profiler=profiler
+    )
     window.run()
+
+
+def create_profiler():
+    """Create a profiler that appends the timings of the phases of the game to the profile file"""
+    from .constants import PROFILE_DUMP_INTERVAL, PROFILE_FILE_NAME
+    from .timing import Profiler
+
+    return Profiler(PROFILE_FILE_NAME, PROFILE_DUMP_INTERVAL)
@@ -0,0 +1,206 @@
+from .world import Cactus, DinosaurAI, Herd
+from .event_handlers import NEATEventHandler
+from .libs.neat import load_config
+from .constants import NEAT_CONFIG_FILE_NAME, UPDATE_INTERVAL
+from argparse import ArgumentParser
+from time import perf_counter
+import json
+import platform
+import random
+import numpy as np
+
+
+# Population sizes and course measured by default
+SIZES = (100, 1000, 10000, 50000)
+SEED = 0
+
+# Minimum time (in seconds) spent measuring each rate
+MIN_TIME = 1
+
+# Position of the herd, the same as in the game
+HERD_X = 65
+HERD_Y = 45
+
+
+def create_genomes(config, size, seed, mutations=0):
+    """Create a reproducible population of new genomes of any size, mutated a number of times
+    (to give them hidden nodes and disabled connections) if requested."""
+    # neat-python draws the initial weights and the mutations from the random module
+    random.seed(seed)
+    genomes = []
+
+    for key in range(size):
+        genome = config.genome_type(key)
+        genome.configure_new(config.genome_config)
+
+        for _ in range(mutations):
+            genome.mutate(config.genome_config)
+
+        genomes.append(genome)
+
+    return genomes
+
+
+def measure(function, min_time=MIN_TIME):
+    """Call the function until the minimum time elapsed and get the number of calls per second."""
+    calls = 0
+    start_time = perf_counter()
+
+    while True:
+        function()
+        calls += 1
+        elapsed = perf_counter() - start_time
+
+        if elapsed >= min_time:
+            return calls / elapsed
+
+
+def bench_world_ticks(genomes, config, seed, min_time=MIN_TIME):
+    """Measure how many steps of the whole world are taken per second."""
+    game = NEATEventHandler(headless=True)
+    ticks = 0
+    alive = 0
+    elapsed = 0
+
+    while elapsed < min_time:
+        # Replay the course whenever the herd is gone, without counting the time it takes
+        if not game.dinosaurs:
+            game.reset()
+            game.schedule(seed)
+            game.dinosaurs = Herd(HERD_X, HERD_Y, genomes, config)
+
+        alive += len(game.dinosaurs)
+        start_time = perf_counter()
+        game.update(UPDATE_INTERVAL)
+        elapsed += perf_counter() - start_time
+        ticks += 1
+
+    return {"ticks_per_second": ticks / elapsed, "mean_alive": alive / ticks}
+
+
+def bench_herd_think(genomes, config, min_time=MIN_TIME):
+    """Measure how many network activations per second the herd makes when thinking together."""
+    herd = Herd(HERD_X, HERD_Y, genomes, config)
+    obstacle = Cactus(600, HERD_Y)
+    calls_per_second = measure(lambda: herd.think(obstacle), min_time)
+    return {"activations_per_second": calls_per_second * len(genomes)}
+
+
+def bench_dinosaur_ai_think(genomes, config, min_time=MIN_TIME):
+    """Measure how many network activations per second the dinosaurs make when thinking one by one."""
+    dinosaurs = [DinosaurAI(HERD_X, HERD_Y, genome=genome, config=config) for genome in genomes]
+    obstacle = Cactus(600, HERD_Y)
+
+    def think():
+        for dinosaur in dinosaurs:
+            dinosaur.think(obstacle)
+
+    calls_per_second = measure(think, min_time)
+    return {"activations_per_second": calls_per_second * len(genomes)}
+
+
+def bench_collision(genomes, config, min_time=MIN_TIME):
+    """Measure how many dinosaur-obstacle pairs are tested per second."""
+    herd = Herd(HERD_X, HERD_Y, genomes, config)
+
+    # The obstacles are out of reach so that every dinosaur stays alive
+    obstacles = [Cactus(x, HERD_Y) for x in (400, 800, 1100)]
+    calls_per_second = measure(lambda: herd.collide(obstacles), min_time)
+    return {"checks_per_second": calls_per_second * len(genomes) * len(obstacles)}
+
+
+def bench_generation(genomes, config, seed):
+    """Measure how long it takes to evaluate a whole generation on the course."""
+    game = NEATEventHandler(headless=True)
+    start_time = perf_counter()
+    game.simulate(genomes, config, seed)
+    wall_time = perf_counter() - start_time
+    return {"wall_time": wall_time, "simulated_time": max(genome.fitness for genome in genomes)}
+
+
+def run_benchmarks(sizes=SIZES, seed=SEED, min_time=MIN_TIME, config_file=NEAT_CONFIG_FILE_NAME):
+    """Run every benchmark at every population size and get the results."""
+    config = load_config(config_file=config_file)
+    results = {}
+
+    for size in sizes:
+        print(f"Population of {size}...")
+        genomes = create_genomes(config, size, seed)
+        results[str(size)] = {
+            "world_ticks": bench_world_ticks(genomes, config, seed, min_time),
+            "herd_think": bench_herd_think(genomes, config, min_time),
+            "dinosaur_ai_think": bench_dinosaur_ai_think(genomes, config, min_time),
+            "collision": bench_collision(genomes, config, min_time),
+            "generation": bench_generation(genomes, config, seed)
+        }
+
+    return {
+        "seed": seed,
+        "min_time": min_time,
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "machine": platform.machine(),
+        "results": results
+    }
+
+
+def compare(report, baseline):
+    """Get the speedup of every measure over the baseline (above 1 is faster)."""
+    speedups = {}
+
+    for size, benchmarks in report["results"].items():
+        for name, measures in benchmarks.items():
+            for measure_name, value in measures.items():
+                try:
+                    baseline_value = baseline["results"][size][name][measure_name]
+                except KeyError:
+                    continue
+
+                # Only rates and wall times are compared
+                if measure_name.endswith("_per_second"):
+                    speedups[f"{size}/{name}/{measure_name}"] = value / baseline_value
+                elif measure_name == "wall_time":
+                    speedups[f"{size}/{name}/{measure_name}"] = baseline_value / value
+
+    return speedups
+
+
+def add_arguments(parser):
+    """Add the options of the benchmarks to a command line parser."""
+    parser.add_argument("--sizes", type=int, nargs="+", default=SIZES, help="population sizes")
+    parser.add_argument("--seed", type=int, default=SEED, help="seed of the course and the genomes")
+    parser.add_argument("--min-time", type=float, default=MIN_TIME, help="seconds spent measuring each rate")
+    parser.add_argument("--config", default=NEAT_CONFIG_FILE_NAME, help="NEAT config file of the genomes")
+    parser.add_argument("--output", default="benchmark.json", help="file the results are written to")
+    parser.add_argument("--baseline", help="results of a previous run to compare against")
+
+
+def main(args=None):
+    """Run the benchmarks from the command line."""
+    parser = ArgumentParser(description="Benchmark the game without a display.")
+    add_arguments(parser)
+    report_benchmarks(parser.parse_args(args))
+
+
+def report_benchmarks(args):
+    """Run the benchmarks with the parsed command line options, then save and show the results."""
+    report = run_benchmarks(args.sizes, args.seed, args.min_time, args.config)
+
+    if args.baseline is not None:
+        with open(args.baseline) as file:
+            report["speedups"] = compare(report, json.load(file))
+
+    with open(args.output, "w") as file:
+        json.dump(report, file, indent=2)
+
+    for size, benchmarks in report["results"].items():
+        for name, measures in benchmarks.items():
+            values = ", ".join(f"{measure_name}={value:.4g}" for measure_name, value in measures.items())
+            print(f"{size:>6} {name:<18} {values}")
+
+    for name, speedup in report.get("speedups", {}).items():
+        print(f"{name}: {speedup:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
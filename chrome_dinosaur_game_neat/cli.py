@@ -0,0 +1,154 @@
+from . import replay, run
+from .constants import COORDINATOR_ADDRESS, GENERATIONS, NEAT_CONFIG_FILE_NAME
+from argparse import ArgumentParser, ArgumentTypeError
+import sys
+
+
+def positive_int(text):
+    """Parse a whole number above 0."""
+    value = int(text)
+
+    if value < 1:
+        raise ArgumentTypeError(f"{text} is not above 0")
+
+    return value
+
+
+def address(text):
+    """Parse a host:port address."""
+    host, _, port = text.rpartition(":")
+
+    if not host or not port.isdigit():
+        raise ArgumentTypeError(f"{text} is not a host:port address")
+
+    return host, int(port)
+
+
+def add_window_arguments(parser):
+    """Add the options of the games played in a window to a command line parser."""
+    parser.add_argument("--night", action="store_true", help="enable night mode")
+    parser.add_argument("--turbo", action="store_true", help="step the game as fast as possible while drawing it")
+    parser.add_argument("--profile", action="store_true", help="time the phases of the game and append them to a file")
+
+
+def create_parser():
+    """Create the parser of the command line, with a subcommand per way of running the game."""
+    from .benchmark import add_arguments as add_benchmark_arguments
+
+    parser = ArgumentParser(description="Google Chrome Dinosaur Game (with NEAT)")
+    commands = parser.add_subparsers(dest="command", metavar="command")
+
+    # Play the game with the keyboard
+    play_parser = commands.add_parser("play", help="play the game manually (the default)")
+    add_window_arguments(play_parser)
+
+    # Train the AI in the window, or without one on this machine, across machines or on islands
+    train_parser = commands.add_parser("train", help="train the AI with NEAT")
+    train_parser.add_argument("--population", type=positive_int, help="genomes per generation (default: pop_size)")
+    train_parser.add_argument("--generations", type=positive_int, default=GENERATIONS, help="generations to train")
+    train_parser.add_argument("--seed", type=int, help="seed of the course of every generation")
+    train_parser.add_argument("--config", default=NEAT_CONFIG_FILE_NAME, help="NEAT config file")
+    train_parser.add_argument("--headless", action="store_true", help="train without a window")
+
+    # The genomes are evaluated in a single way, all of which train without a window
+    mode = train_parser.add_mutually_exclusive_group()
+    mode.add_argument("--parallel", action="store_true", help="train without a window across worker processes")
+    mode.add_argument("--coordinator", action="store_true", help="send the genomes to workers over TCP")
+    mode.add_argument("--islands", action="store_true", help="evolve several populations that exchange genomes")
+    train_parser.add_argument("--workers", type=positive_int, help="processes in parallel mode (default: every core)")
+    train_parser.add_argument(
+        "--address",
+        type=address,
+        help=f"host:port the coordinator listens on (default: {COORDINATOR_ADDRESS[0]}:{COORDINATOR_ADDRESS[1]})"
+    )
+    train_parser.add_argument("--resume", action="store_true", help="resume the training from the latest checkpoint")
+    add_window_arguments(train_parser)
+
+    # Evaluate the genomes of a coordinator
+    worker_parser = commands.add_parser("worker", help="evaluate the genomes sent by a coordinator")
+    worker_parser.add_argument("--workers", type=positive_int, help="worker processes (default: every core)")
+    worker_parser.add_argument("--address", type=address, default=COORDINATOR_ADDRESS, help="coordinator host:port")
+
+    # Watch trained networks play
+    replay_parser = commands.add_parser("replay", help="watch the exported winner or a stored genome play")
+    source = replay_parser.add_mutually_exclusive_group()
+    source.add_argument("--policy", help="policy file exported by a training run (default: the winner)")
+    source.add_argument("--genome", type=int, help="ID of a genome in the genome store")
+    replay_parser.add_argument("--store", help="genome store the genome is loaded from")
+    replay_parser.add_argument("--config", default=NEAT_CONFIG_FILE_NAME, help="NEAT config file of the genome")
+    replay_parser.add_argument("--seed", type=int, help="seed of the course of every game")
+    add_window_arguments(replay_parser)
+
+    # Measure the speed of the game without a display
+    bench_parser = commands.add_parser("bench", help="benchmark the game without a display")
+    add_benchmark_arguments(bench_parser)
+
+    return parser
+
+
+def check_train_arguments(parser, args):
+    """Reject the options of the train command that don't apply to the requested way of training."""
+    headless = args.headless or args.parallel or args.coordinator or args.islands
+
+    # The islands aren't saved to checkpoints, so they can't be resumed
+    if args.resume and args.islands:
+        parser.error("train: --resume can't be used with --islands")
+
+    if args.workers is not None and not args.parallel:
+        parser.error("train: --workers only applies to --parallel")
+
+    if args.address is not None and not args.coordinator:
+        parser.error("train: --address only applies to --coordinator")
+
+    for option in ("night", "turbo"):
+        if getattr(args, option) and headless:
+            parser.error(f"train: --{option} only applies to training in a window")
+
+
+def main(args=None):
+    """Run the game from the command line."""
+    if args is None:
+        args = sys.argv[1:]
+
+    # The game is played manually when no subcommand is given
+    parser = create_parser()
+    args = parser.parse_args(args or ["play"])
+
+    if args.command == "play":
+        run(night_mode=args.night, turbo=args.turbo, profile=args.profile)
+    elif args.command == "train":
+        check_train_arguments(parser, args)
+        run(
+            enable_neat=True,
+            night_mode=args.night,
+            headless=args.headless,
+            parallel=args.parallel,
+            num_workers=args.workers,
+            turbo=args.turbo,
+            profile=args.profile,
+            resume=args.resume,
+            coordinator=args.coordinator,
+            address=args.address,
+            islands=args.islands,
+            population_size=args.population,
+            generations=args.generations,
+            seed=args.seed,
+            config_file=args.config
+        )
+    elif args.command == "worker":
+        run(worker=True, num_workers=args.workers, address=args.address)
+    elif args.command == "replay":
+        replay(
+            policy_file=args.policy,
+            genome_id=args.genome,
+            store_file=args.store,
+            config_file=args.config,
+            seed=args.seed,
+            night_mode=args.night,
+            turbo=args.turbo,
+            profile=args.profile
+        )
+    else:
+        from .benchmark import report_benchmarks
+
+        report_benchmarks(args)
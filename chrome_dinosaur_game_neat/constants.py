@@ -3,7 +3,47 @@ import os
 
 WINDOW_WIDTH = 1200
 WINDOW_HEIGHT = 400
-GENERATIONS = 25
-POPULATION_SIZE = 100
-FONT_FILE_NAME = os.path.abspath("chrome_dinosaur_game_neat/assets/fonts/press_start_2p.ttf")
+GENERATIONS = 25  # Generations trained by default (the population size is pop_size in the NEAT config file)
+UPDATE_INTERVAL = 1 / 60
+DRAW_INTERVAL = 1 / 60  # Time between two frames drawn by the window
+DRAWN_DINOSAURS = 25  # Most dinosaurs drawn at once in NEAT mode
+OBSTACLE_VELOCITY = -600  # Horizontal velocity of the obstacles at the start of the game
+VELOCITY_INCREMENT = -5  # Change of the obstacle velocity every VELOCITY_INTERVAL
+VELOCITY_INTERVAL = 1  # Seconds between two changes of the obstacle velocity
+SCORE_INTERVAL = 0.1  # Seconds between two points of the score
+PHYSICS_INTERVAL = 1 / 60  # Fixed step of the game logic, or None to step by the frame time
+EVENT_DRIVEN = True  # Skip the steps without any obstacle ahead of the dinosaurs when simulating without a window
+DECISION_STEPS = 1  # Steps between two decisions of the networks, which are held in between (1 to decide at every step)
+TURBO_FRAME_BUDGET = 0.75 * DRAW_INTERVAL  # Time spent stepping the game per frame in turbo mode
+PROFILE_DUMP_INTERVAL = 10  # Seconds between two appends to the profile file
+CHECKPOINT_INTERVAL = 1  # Generations between two checkpoints
+CHECKPOINTS_KEPT = 3  # Number of latest checkpoints kept on disk
+GENOMES_STORED_PER_GENERATION = 5  # Number of the fittest genomes stored after each generation
+REPORT_WINDOW = 100  # Number of the latest generation summaries kept in memory
+FITNESS_CACHE_SIZE = 10000  # Most fitness values of genomes on a course remembered to skip replaying them
+COORDINATOR_ADDRESS = ("localhost", 6150)  # Where the coordinator listens for workers (use "0.0.0.0" to accept other hosts)
+COORDINATOR_AUTHKEY = os.environ.get("DINOSAUR_AUTHKEY")  # Secret shared by the coordinator and workers (required unless the address is a loopback address)
+BATCH_SIZE = 25  # Genomes sent to a worker at once
+WORKER_TIMEOUT = 60  # Seconds a worker has to evaluate a batch before it's given to another worker
+ISLANDS = (  # NEAT settings replaced on each island in island mode, one island per entry
+    {},
+    {"compatibility_threshold": 2.5},
+    {"conn_add_prob": 0.7, "node_add_prob": 0.4},
+    {"weight_mutate_power": 1.0, "bias_mutate_power": 1.0}
+)
+MIGRATION_INTERVAL = 5  # Generations between two migrations between the islands
+MIGRANTS = 2  # Fittest genomes of an island sent to its neighbours at every migration
+MIGRATION_TOPOLOGY = "ring"  # "ring" to send the migrants to the next island, "full" to send them to every island
+PACKAGE_DIR = os.path.dirname(os.path.abspath(__file__))
+ASSETS_DIR = os.path.join(PACKAGE_DIR, "assets")
+FONT_FILE_NAME = os.path.join(ASSETS_DIR, "fonts", "press_start_2p.ttf")
 FONT_NAME = "Press Start 2P"
+SPRITE_MAP_FILE_NAME = os.path.join(ASSETS_DIR, "images", "sprites.png")
+NEAT_CONFIG_FILE_NAME = os.path.join(PACKAGE_DIR, "neat_config.txt")  # NEAT settings used unless another file is given
+GENOME_STORE_FILE_NAME = os.path.join(PACKAGE_DIR, "genomes.db")  # Database of the best genomes
+POLICY_FILE_NAME = os.path.join(PACKAGE_DIR, "winner.npz")  # Networks of the best genome, for NumPy alone
+LEGACY_WINNER_FILE_NAME = os.path.join(PACKAGE_DIR, "winner.pkl")  # Best genome saved by older versions of the game
+CHECKPOINT_DIR = os.path.join(PACKAGE_DIR, "checkpoints")  # Directory the NEAT training is saved to
+REPORT_FILE_NAME = os.path.join(PACKAGE_DIR, "training.csv")  # File a summary of every generation is appended to (CSV or JSON lines)
+PROFILE_FILE_NAME = os.path.join(PACKAGE_DIR, "profile.jsonl")  # File the phase timings are appended to when profiling
+AUTHKEY_FILE_NAME = os.path.join(PACKAGE_DIR, "authkey")  # Random key of a coordinator on a loopback address, only readable by its user
@@ -0,0 +1,2 @@
+from .environment import Environment
+from .vector_environment import VectorEnvironment
@@ -0,0 +1,18 @@
+from .vector_environment import VectorEnvironment
+from ..constants import UPDATE_INTERVAL
+
+
+class Environment(VectorEnvironment):
+    def __init__(self, seed=None, dt=UPDATE_INTERVAL, time_limit=None):
+        """Create an environment where a single dinosaur plays the game."""
+        super().__init__(1, seed=seed, dt=dt, time_limit=time_limit)
+
+    def reset(self, seed=None):
+        """Start an episode on the course of the seed (or a random one) and get the first observation."""
+        return super().reset(seed)[0]
+
+    def step(self, action):
+        """Let the dinosaur take its (duck, jump) action and advance the world by a step.
+        Get the observation, the reward, whether the episode is over and information."""
+        observations, rewards, dones, info = super().step(action)
+        return observations[0], float(rewards[0]), bool(dones[0]), info
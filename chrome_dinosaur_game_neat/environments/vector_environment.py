@@ -0,0 +1,89 @@
+from ..world import Dinosaur, Herd
+from ..event_handlers.base import BaseEventHandler
+from ..constants import UPDATE_INTERVAL
+import numpy as np
+
+
+class VectorEnvironment:
+    # Number of features observed by each dinosaur and of values in each action
+    OBSERVATION_SIZE = 6
+    ACTION_SIZE = 2
+
+    def __init__(self, num_dinosaurs, seed=None, dt=UPDATE_INTERVAL, time_limit=None):
+        """Create an environment where many independent dinosaurs play the same course at once.
+        The courses of the episodes are picked from the seed, if given."""
+        self.num_dinosaurs = num_dinosaurs
+        self.dt = dt
+        self.time_limit = time_limit
+
+        # Run the world logic of the game without a window
+        self.game = BaseEventHandler(headless=True)
+        self.game.random.seed(seed)
+        self.dinosaurs = None
+        self.time = 0
+
+    def reset(self, seed=None):
+        """Start an episode on the course of the seed (or a random one) and get the first observations."""
+        self.game.reset()
+        self.game.schedule(seed)
+        self.dinosaurs = Herd(65, 45, size=self.num_dinosaurs)
+        self.time = 0
+        return self.observe()
+
+    def get_next_obstacle(self):
+        """Get the obstacle the dinosaurs have to avoid next, if any."""
+        return self.game.obstacles.get_next()
+
+    def observe(self):
+        """Get the inputs the neural networks of the game receive, with zeros for the dinosaurs that are gone
+        and for every dinosaur while there is no obstacle."""
+        observations = np.zeros((self.num_dinosaurs, self.OBSERVATION_SIZE))
+        obstacle = self.get_next_obstacle()
+
+        if obstacle is not None and len(self.dinosaurs):
+            observations[self.dinosaurs.alive_indices] = self.dinosaurs.observe(obstacle)
+
+        return observations
+
+    def step(self, actions):
+        """Let every dinosaur take its (duck, jump) action, where values above 0.5 trigger the moves,
+        and advance the world by a step. Get the observations, rewards, done flags and information."""
+        if self.dinosaurs is None:
+            raise RuntimeError('The environment must be reset before stepping it!')
+
+        actions = np.asarray(actions, dtype=float).reshape(self.num_dinosaurs, self.ACTION_SIZE)
+
+        # Every dinosaur that takes the step is rewarded for it, as in the game
+        alive = self.dinosaurs.alive.copy()
+        self.dinosaurs.reward(self.dt)
+        rewards = np.where(alive, self.dt, 0)
+
+        # Like the AI of the game, the dinosaurs only act when there is an obstacle ahead
+        if self.get_next_obstacle() is not None and len(self.dinosaurs):
+            self.dinosaurs.update(self.dt, actions[self.dinosaurs.alive_indices])
+        else:
+            self.dinosaurs.update(self.dt, None)
+
+        self.game.update(self.dt)
+        x = self.dinosaurs.x
+        self.dinosaurs.collide(self.game.obstacles.get_range(x, x + Dinosaur.MAX_WIDTH))
+        self.time += self.dt
+
+        # Every episode is over once its time limit is reached
+        dones = ~self.dinosaurs.alive
+        truncated = self.time_limit is not None and self.time >= self.time_limit
+
+        if truncated:
+            dones[:] = True
+
+        info = {
+            "time": self.time,
+            "score": self.game.score,
+            "alive": len(self.dinosaurs),
+            "truncated": truncated
+        }
+        return self.observe(), rewards, dones, info
+
+    def close(self):
+        """Close the environment."""
+        self.game.on_close()
@@ -1,2 +1,3 @@
 from .player import PlayerEventHandler
 from .neat import NEATEventHandler
+from .replay import ReplayEventHandler
@@ -1,60 +1,120 @@
-import pyglet
-from ..sprites import (
+from ..world import (
     Bird,
     Cactus,
     Cloud,
+    Course,
     Moon,
+    ObstacleQueue,
     Star,
-    Terrain
+    Terrain,
+    get_course
 )
-from ..gui.hud import ScoreDisplay
-from random import uniform, randint, choice
+from ..constants import (
+    OBSTACLE_VELOCITY,
+    PHYSICS_INTERVAL,
+    SCORE_INTERVAL,
+    VELOCITY_INCREMENT,
+    VELOCITY_INTERVAL
+)
+from random import Random
 
 
 class BaseEventHandler:
-    def __init__(self, night_mode=False):
+    # Methods called in order to update the game by a step
+    PHASES = (
+        "update_obstacles",
+        "update_terrain",
+        "update_clouds",
+        "update_moon",
+        "update_opacity",
+        "update_stars",
+        "update_score",
+        "update_cloud_spawn",
+        "update_obstacle_spawn",
+        "update_star_spawn",
+        "update_velocity"
+    )
+
+    def __init__(self, night_mode=False, headless=False):
         """Create an event handler that allows the user to play the game manually."""
         # Keep track of when the program is terminated
         self.user_exit = False
 
         # Control the horizontal velocity of the obstacles
-        self.obstacle_velx = -600
+        self.obstacle_velx = OBSTACLE_VELOCITY
+
+        # Score
+        self.score = 0
 
-        # Create batches and groups
-        self.batch = pyglet.graphics.Batch()
-        self.background = pyglet.graphics.OrderedGroup(0)
-        self.foreground = pyglet.graphics.OrderedGroup(1)
-        self.hud = pyglet.graphics.OrderedGroup(2)
+        # Split the frame time into fixed steps so that the game plays the same at any frame rate
+        self.substep = PHYSICS_INTERVAL
+        self.accumulated_time = 0
 
-        # Score and label
-        self.score_display = ScoreDisplay(self.batch, self.hud, night_mode)
+        # Only time the phases of the updates when a profiler is enabled
+        self.profiler = None
+        self.phases = [getattr(self, phase) for phase in self.PHASES]
 
-        # Initialize the sprites
+        # Initialize the world
         self.terrain = [
-            Terrain(0, 50, velx=self.obstacle_velx, batch=self.batch, group=self.background),
-            Terrain(2400, 50, velx=self.obstacle_velx, batch=self.batch, group=self.background)
+            Terrain(0, 50, velx=self.obstacle_velx),
+            Terrain(2400, 50, velx=self.obstacle_velx)
         ]
-        self.moon = Moon(2920, 275, velx=-20, batch=self.batch, group=self.background)
+        self.moon = Moon(2920, 275, velx=-20)
 
-        # These elements will be randomly generated as the game progresses
+        # These elements are spawned from the course as the game progresses.
+        # The obstacles are kept in order to find the next one ahead of the dinosaurs at x=65.
         self.clouds = []
-        self.obstacles = []
+        self.obstacles = ObstacleQueue(65)
         self.stars = []
 
-        # Add delays to control when events happen
-        self.next_score_increment = 0.1
-        self.next_cloud_spawn = uniform(1, 4)
-        self.next_obstacle_spawn = uniform(1, 3)
-        self.next_star_spawn = 0  # Spawn a star immediately
-        self.next_velocity_increase = 1
+        # Pick the seeds of random courses with its own random number generator
+        # so that the other users of the random module aren't affected
+        self.random = Random()
+        self.schedule()
 
         # Control the star opacity by increasing it when the moon comes out
         self.star_opacity = 0
 
+        # Draw the world with pyglet unless the game runs without a display
+        self.headless = headless
+
+        if not headless:
+            self.create_view(night_mode)
+
     def run(self):
         """Run the game."""
         raise NotImplementedError()
 
+    @property
+    def finished(self):
+        """Check if the game stopped and there is nothing left to update."""
+        return False
+
+    def enable_profiling(self, profiler):
+        """Time every phase of the updates with the profiler, or stop timing them if it is None."""
+        self.profiler = profiler
+
+        if profiler is None:
+            self.phases = [getattr(self, phase) for phase in self.PHASES]
+        else:
+            self.phases = [profiler.time(phase, getattr(self, phase)) for phase in self.PHASES]
+
+    def schedule(self, seed=None):
+        """Start the course of the seed (or a random one) and add delays to control when events happen."""
+        if seed is None:
+            seed = self.random.randrange(2 ** 32)
+
+        self.course = get_course(seed)
+        self.obstacle_index = 0
+        self.cloud_index = 0
+        self.star_index = 0
+
+        self.next_score_increment = SCORE_INTERVAL
+        self.next_cloud_spawn = self.course.get_cloud(0)[0]
+        self.next_obstacle_spawn = self.course.get_obstacle(0)[0]
+        self.next_star_spawn = self.course.get_star(0)[0]
+        self.next_velocity_increase = VELOCITY_INTERVAL
+
     def on_key_press(self, symbol, modifiers):
         """Handle the events when a key is pressed."""
         pass
@@ -67,9 +127,24 @@ class BaseEventHandler:
         """Handle the events when the mouse is pressed."""
         pass
 
+    def create_view(self, night_mode):
+        """Create the renderer and the HUD that draw the world."""
+        # Import the view here so headless runs never load pyglet's windowing modules
+        from ..gui.hud import ScoreDisplay
+        from ..gui.renderer import Renderer
+
+        self.renderer = Renderer()
+        self.score_display = ScoreDisplay(self.renderer.batch, self.renderer.hud, night_mode)
+
     def draw(self):
         """Draw the contents of the game onto the window."""
-        self.batch.draw()
+        self.renderer.sync(self.terrain, self.renderer.background)
+        self.renderer.sync((self.moon,), self.renderer.background)
+        self.renderer.sync(self.clouds, self.renderer.background)
+        self.renderer.sync(self.stars, self.renderer.background)
+        self.renderer.sync(self.obstacles, self.renderer.foreground)
+        self.score_display.set(self.score)
+        self.renderer.draw()
 
     def update_dinosaurs(self, dt):
         """Update the dinosaur."""
@@ -77,18 +152,7 @@ class BaseEventHandler:
 
     def update_obstacles(self, dt):
         """Update the obstacles."""
-        obstacles_to_remove = []
-
-        for obstacle in self.obstacles:
-            # Delete any obstacles that ran off the screen
-            if obstacle.x + obstacle.width < 0:
-                obstacles_to_remove.append(obstacle)
-            else:
-                obstacle.update(dt)
-
-        for obstacle in obstacles_to_remove:
-            obstacle.delete()
-            self.obstacles.remove(obstacle)
+        self.obstacles.update(dt)
 
     def update_terrain(self, dt):
         """Update the terrain."""
@@ -140,97 +204,88 @@ class BaseEventHandler:
         """Update the score and reset the schedule if needed."""
         self.next_score_increment -= dt
 
-        if self.next_score_increment <= 0:
-            self.score_display.increment(1)
-            self.next_score_increment += 0.1
+        # The timers run out at whole intervals, whatever the rounding of the time that was counted down
+        if self.next_score_increment <= 1e-9:
+            self.score += 1
+            self.next_score_increment += SCORE_INTERVAL
 
     def update_cloud_spawn(self, dt):
         """Update the cloud spawn delay and create a cloud if needed."""
         self.next_cloud_spawn -= dt
 
-        if self.next_cloud_spawn <= 0:
-            cloud = Cloud(
-                1200,
-                randint(225, 325),
-                velx=-150,
-                batch=self.batch,
-                group=self.background
-            )
+        while self.next_cloud_spawn <= 0:
+            time, y = self.course.get_cloud(self.cloud_index)
+            cloud = Cloud(1200, y, velx=-150)
             self.clouds.append(cloud)
-            self.next_cloud_spawn += uniform(2, 5)
+
+            self.cloud_index += 1
+            self.next_cloud_spawn += self.course.get_cloud(self.cloud_index)[0] - time
 
     def update_obstacle_spawn(self, dt):
         """Update the obstacle spawn delay and create an obstacle if needed."""
         self.next_obstacle_spawn -= dt
 
-        if self.next_obstacle_spawn <= 0:
-            object_type = randint(1, 6)
-
-            if object_type == 6:
-                bird = Bird(
-                    1200,
-                    choice((50, 125, 200)),
-                    velx=self.obstacle_velx - 100,
-                    batch=self.batch,
-                    group=self.foreground
-                )
+        while self.next_obstacle_spawn <= 0:
+            time, kind, image, y, velx = self.course.get_obstacle(self.obstacle_index)
+
+            if kind == Course.BIRD:
+                bird = Bird(1200, y, velx=velx)
                 self.obstacles.append(bird)
             else:
-                cactus = Cactus(
-                    1200,
-                    45,
-                    velx=self.obstacle_velx,
-                    batch=self.batch,
-                    group=self.foreground
-                )
+                cactus = Cactus(1200, y, velx=velx, image_index=image)
                 self.obstacles.append(cactus)
 
-            self.next_obstacle_spawn = uniform(1, 2.5)
+            self.obstacle_index += 1
+            self.next_obstacle_spawn += self.course.get_obstacle(self.obstacle_index)[0] - time
 
     def update_star_spawn(self, dt):
         """Update the star spawn delay and create a star if needed."""
         self.next_star_spawn -= dt
 
-        if self.next_star_spawn <= 0:
-            star = Star(
-                1200,
-                randint(200, 350),
-                velx=-10,
-                batch=self.batch,
-                group=self.background
-            )
+        while self.next_star_spawn <= 0:
+            time, y, image = self.course.get_star(self.star_index)
+            star = Star(1200, y, velx=-10, image_index=image)
             self.stars.append(star)
-            self.next_star_spawn += uniform(30, 50)
+
+            self.star_index += 1
+            self.next_star_spawn += self.course.get_star(self.star_index)[0] - time
 
     def update_velocity(self, dt):
         """Update the velocity and increase it if needed."""
         self.next_velocity_increase -= dt
 
-        if self.next_velocity_increase <= 0:
-            increment = -5  # Increment to change the velocity by
+        if self.next_velocity_increase <= 1e-9:
+            self.increase_velocity(VELOCITY_INCREMENT)
+            self.next_velocity_increase += VELOCITY_INTERVAL
+
+    def increase_velocity(self, increment):
+        """Change the velocity of the terrain and the obstacles by the increment."""
+        for terrain in self.terrain:
+            terrain.velx += increment
+
+        for obstacle in self.obstacles:
+            obstacle.velx += increment
+
+        self.obstacle_velx += increment
 
-            for terrain in self.terrain:
-                terrain.velx += increment
+    def advance(self, dt):
+        """Advance the game by the elapsed time, in fixed steps if sub-stepping is enabled."""
+        if self.substep is None:
+            self.update(dt)
+            return
 
-            for obstacle in self.obstacles:
-                obstacle.velx += increment
+        # Carry the time that doesn't fill a whole step over to the next call
+        self.accumulated_time += dt
+        steps = int(self.accumulated_time / self.substep + 1e-9)
+        self.accumulated_time -= steps * self.substep
 
-            self.obstacle_velx += increment
-            self.next_velocity_increase += 1
+        for _ in range(steps):
+            self.update(self.substep)
 
     def update(self, dt):
         """Update the objects."""
-        self.update_obstacles(dt)
-        self.update_terrain(dt)
-        self.update_clouds(dt)
-        self.update_moon(dt)
-        self.update_opacity(dt)
-        self.update_stars(dt)
-        self.update_score(dt)
-        self.update_cloud_spawn(dt)
-        self.update_obstacle_spawn(dt)
-        self.update_star_spawn(dt)
-        self.update_velocity(dt)
+        for phase in self.phases:
+            phase(dt)
 
     def reset(self):
         """Reset the game."""
@@ -239,10 +294,11 @@ class BaseEventHandler:
             obstacle.delete()
 
         self.obstacles.clear()
-        self.score_display.set(0)
+        self.score = 0
+        self.accumulated_time = 0
 
         # Reset the velocities (obstacles are deleted, so we don't need to worry about them)
-        self.obstacle_velx = -600
+        self.obstacle_velx = OBSTACLE_VELOCITY
 
         for terrain in self.terrain:
             terrain.velx = self.obstacle_velx
@@ -1,51 +1,313 @@
-from ..sprites import DinosaurAI
-from ..gui.hud import DinosaurCountDisplay, GenerationDisplay
+from ..world import Dinosaur, Herd
 from .base import BaseEventHandler
-from ..libs.neat import Population
-from ..constants import GENERATIONS, POPULATION_SIZE
+from ..libs.fitness_cache import FitnessCache
+from ..libs.genome_store import GenomeStore
+from ..libs.neat import (
+    Checkpointer,
+    DistributedEvaluator,
+    IslandModel,
+    ParallelEvaluator,
+    Population,
+    StreamingReporter,
+    export_policy,
+    list_checkpoints,
+    load_config
+)
+from ..constants import (
+    BATCH_SIZE,
+    CHECKPOINT_DIR,
+    CHECKPOINT_INTERVAL,
+    CHECKPOINTS_KEPT,
+    DECISION_STEPS,
+    DRAWN_DINOSAURS,
+    EVENT_DRIVEN,
+    FITNESS_CACHE_SIZE,
+    GENERATIONS,
+    GENOME_STORE_FILE_NAME,
+    GENOMES_STORED_PER_GENERATION,
+    LEGACY_WINNER_FILE_NAME,
+    MIGRANTS,
+    MIGRATION_INTERVAL,
+    MIGRATION_TOPOLOGY,
+    NEAT_CONFIG_FILE_NAME,
+    POLICY_FILE_NAME,
+    REPORT_FILE_NAME,
+    REPORT_WINDOW,
+    SCORE_INTERVAL,
+    UPDATE_INTERVAL,
+    VELOCITY_INCREMENT,
+    VELOCITY_INTERVAL,
+    WORKER_TIMEOUT
+)
+from concurrent.futures import ThreadPoolExecutor
+from time import perf_counter
 import pyglet
+import math
 import os
 import pickle
+import random
 
 
 class NEATEventHandler(BaseEventHandler):
+    # The dinosaurs move before the rest of the world
+    PHASES = ("update_dinosaurs",) + BaseEventHandler.PHASES
+
+    # States of the training in the window
+    PLAYING = "playing"
+    BREEDING = "breeding"
+    DONE = "done"
+
     # Constructor
-    def __init__(self, night_mode=False):
+    def __init__(
+        self,
+        night_mode=False,
+        headless=False,
+        seed=None,
+        generations=GENERATIONS,
+        overrides=None,
+        config_file=NEAT_CONFIG_FILE_NAME,
+        parallel=False,
+        num_workers=None,
+        address=None,
+        authkey=None,
+        islands=None,
+        checkpoint_dir=CHECKPOINT_DIR,
+        resume=False,
+        store_file=GENOME_STORE_FILE_NAME,
+        report_file=REPORT_FILE_NAME,
+        cache_fitness=True,
+        event_driven=EVENT_DRIVEN,
+        decision_steps=DECISION_STEPS
+    ):
         """Create an event handler that uses the NEAT algorithm to play the game."""
-        super().__init__(night_mode=night_mode)
+        super().__init__(night_mode=night_mode, headless=headless)
+
+        # Keep track of the generation and the dinosaurs that are still alive
+        self.generation = -1
+        self.dinosaurs = None
+
+        # Only draw the fittest dinosaurs, the others are summed up by a counter
+        self.drawn_dinosaurs = DRAWN_DINOSAURS
+
+        # The networks decide every few steps, and without a window the steps where nothing
+        # can happen to the dinosaurs are skipped if requested
+        self.decision_steps = decision_steps
+        self.steps_to_decision = 0
+        self.event_driven = event_driven
+
+        # Every generation plays the course of the seed (or a new random course if not given)
+        self.seed = seed
+
+        # Train for the number of generations with the NEAT settings of the config file,
+        # replacing those given in the overrides (such as pop_size)
+        self.generations = generations
+        self.overrides = overrides or {}
+        self.config_file = config_file
+
+        # Evaluate the genomes in worker processes instead of this game if requested
+        self.parallel = parallel
+        self.num_workers = num_workers
+        self.evaluator = None
+
+        # Or send them to the workers that connect to the address (host, port) with the key, possibly from other machines
+        self.address = address
+        self.authkey = authkey
+
+        # Or evolve a population per island (given as the NEAT settings it replaces) in its own process
+        self.islands = islands
+
+        # Save the training in the directory (unless it's None) and resume from its latest checkpoint if requested
+        self.checkpoint_dir = checkpoint_dir
+        self.resume = resume
+
+        # Store the fittest genomes of every generation in the database file (unless it's None)
+        self.store_file = store_file
+        self.store = None
+        self.run_id = None
+        self.course_seed = None
+
+        # Stream a summary of every generation to the file (unless it's None)
+        self.report_file = report_file
+        self.reporter = None
+
+        # Genomes that already played a course (such as the elites) reuse their fitness values instead of replaying it
+        self.fitness_cache = FitnessCache(FITNESS_CACHE_SIZE) if cache_fitness else None
+
+        # In the window, a single event loop plays the generations one after another
+        # while the population is bred in the background between them
+        self.population = None
+        self.genomes = None
+        self.state = None
+        self.breeder = None
+        self.breeding = None
+        self.start_time = 0
+
+    @property
+    def finished(self):
+        """Check if the game stopped and there is nothing left to update."""
+        return not self.dinosaurs
+
+    def create_view(self, night_mode):
+        """Create the renderer and the HUD that draw the world."""
+        from ..gui.hud import DinosaurCountDisplay, GenerationDisplay, MoreDinosaursDisplay
+
+        super().create_view(night_mode)
 
         # Generation label
-        self.generation_display = GenerationDisplay(self.batch, self.hud, night_mode)
+        self.generation_display = GenerationDisplay(self.renderer.batch, self.renderer.hud, night_mode)
 
         # Number of dinosaurs label
-        self.dinosaur_count_display = DinosaurCountDisplay(self.batch, self.hud, night_mode)
+        self.dinosaur_count_display = DinosaurCountDisplay(self.renderer.batch, self.renderer.hud, night_mode)
+
+        # Number of alive dinosaurs that are not drawn
+        self.more_dinosaurs_display = MoreDinosaursDisplay(self.renderer.batch, self.renderer.hud, night_mode)
 
     def run(self):
         """Set up and run the game with the NEAT algorithm."""
-        # Generate the population
-        population = Population()
+        # The islands evolve their own populations in worker processes
+        if self.islands is not None:
+            config = load_config(self.overrides, self.config_file)
+            previous_best = self.open_store(config)
 
-        # Run the NEAT algorithm and find the best "player"
-        winner = population.run(self.eval_genomes, GENERATIONS)
+            try:
+                winner = self.run_islands()
+            finally:
+                if self.store is not None:
+                    self.store.close()
 
-        # If the program is terminated at the last generation, don't show the results
-        if not self.user_exit:
-            print(f"\nBest genome:\n{winner}")
-            pkl_file = os.path.abspath("chrome_dinosaur_game_neat/winner.pkl")
-
-            # Save the best genome
-            if os.path.exists(pkl_file):
-                saved_genome = self.load_genome(pkl_file)
-
-                if winner.fitness > saved_genome.fitness:
-                    print(
-                        "This genome performed better than the saved genome!\n"
-                        "Overwriting the saved genome with this session's best genome..."
-                    )
-                    self.save_genome(winner, pkl_file)
+            self.export_winner(winner, previous_best, config)
+            return
+
+        # Generate the population, or resume it from the latest checkpoint
+        checkpoints = list_checkpoints(self.checkpoint_dir) if self.resume and self.checkpoint_dir else []
+
+        if checkpoints:
+            print(f"Resuming the training from {checkpoints[-1]}...")
+            population = Population(checkpoints[-1], self.overrides, config_file=self.config_file)
+        else:
+            population = Population(overrides=self.overrides, config_file=self.config_file)
+
+        self.generation = population.generation - 1
+
+        # Compare this run to the genomes stored before it
+        previous_best = self.open_store(population.config)
+
+        # Periodically save the population while training
+        checkpointer = None
+
+        if self.checkpoint_dir is not None:
+            checkpointer = Checkpointer(population, self.checkpoint_dir, CHECKPOINT_INTERVAL, CHECKPOINTS_KEPT)
+            population.add_reporter(checkpointer)
+
+        if self.report_file is not None:
+            self.reporter = StreamingReporter(self.report_file, REPORT_WINDOW)
+            population.add_reporter(self.reporter)
+
+        try:
+            if self.headless:
+                if self.parallel:
+                    self.evaluator = ParallelEvaluator(evaluate_genomes, self.num_workers)
+                elif self.address is not None:
+                    self.evaluator = DistributedEvaluator(self.address, self.authkey, BATCH_SIZE, WORKER_TIMEOUT)
+
+                # Run the NEAT algorithm and find the best "player"
+                winner = population.run(self.eval_genomes, self.generations - population.generation)
             else:
-                print("Saving the best genome...")
-                self.save_genome(winner, pkl_file)
+                # Play the generations in the window until the last one is bred or the window is closed
+                self.population = population
+                self.breeder = ThreadPoolExecutor(max_workers=1)
+
+                if population.generation < self.generations:
+                    self.start_generation()
+                    pyglet.app.run()
+
+                winner = population.best_genome
+        finally:
+            if self.evaluator is not None:
+                self.evaluator.close()
+
+            if self.breeder is not None:
+                self.breeder.shutdown()
+
+            if checkpointer is not None:
+                checkpointer.close()
+
+            if self.reporter is not None:
+                self.reporter.close()
+
+            if self.store is not None:
+                self.store.close()
+
+        self.export_winner(winner, previous_best, population.config)
+
+    def open_store(self, config):
+        """Open the genome store and start this run in it, getting the fittest genome stored before it.
+        Only genomes of the same courses are compared, since fitness values of different courses
+        (or versions of the game) can't be compared."""
+        if self.store_file is None:
+            return None
+
+        self.store = GenomeStore(self.store_file)
+        self.import_winner(config)
+        previous_best = self.store.load_best(self.seed)
+        self.run_id = self.store.start_run()
+        return previous_best
+
+    def export_winner(self, winner, previous_best, config):
+        """Show the best genome of the run and export its networks if it beat the genome stored before the run."""
+        # If the program is terminated at the last generation, don't show the results
+        if self.user_exit:
+            return
+
+        print(f"\nBest genome:\n{winner}")
+
+        if previous_best is None or winner.fitness > previous_best.fitness:
+            if self.store is not None:
+                courses = "on any course" if self.seed is None else f"on the course of seed {self.seed}"
+                print(f"This genome performed better than every genome stored before this session {courses}!")
+
+            print(f"Exporting its networks to {POLICY_FILE_NAME}...")
+            export_policy([winner], config, POLICY_FILE_NAME)
+
+    def run_islands(self):
+        """Evolve the islands in worker processes and get the best genome found by any of them."""
+        # The seeds of the islands are drawn from the seed of the course when one is given, so a seeded run
+        # can be repeated, and the settings replaced for the whole training apply to every island unless
+        # it replaces them too
+        rng = random.Random(self.seed)
+        islands = [({**self.overrides, **overrides}, rng.randrange(2 ** 32)) for overrides in self.islands]
+        model = IslandModel(
+            evaluate_genomes,
+            islands,
+            MIGRATION_INTERVAL,
+            MIGRANTS,
+            MIGRATION_TOPOLOGY,
+            GENOMES_STORED_PER_GENERATION,
+            self.config_file
+        )
+        return model.run(self.generations, self.seed, self.report_island)
+
+    def report_island(self, island, generation, genomes, seed, wall_time):
+        """Show and store the fittest genomes of a generation played by an island."""
+        print(f"Island {island}, generation {generation}: best fitness {genomes[0].fitness:.1f} ({wall_time:.2f} seconds)")
+
+        if self.store is not None:
+            self.store.add(self.run_id, generation, genomes, seed)
+
+    def import_winner(self, config):
+        """Store the genome saved by older versions of the game if the store is empty,
+        and export its networks right away unless networks were already exported."""
+        if len(self.store) or not os.path.exists(LEGACY_WINNER_FILE_NAME):
+            return
+
+        # Its fitness comes from another version of the game, so it's stored without a seed
+        # and isn't compared to the genomes trained by this one
+        genome = self.load_genome(LEGACY_WINNER_FILE_NAME)
+        self.store.add(self.store.start_run(), 0, [genome])
+
+        if not os.path.exists(POLICY_FILE_NAME):
+            print(f"Exporting the networks of the genome saved by an older version of the game to {POLICY_FILE_NAME}...")
+            export_policy([genome], config, POLICY_FILE_NAME)
 
     @staticmethod
     def load_genome(path):
@@ -53,78 +315,276 @@ class NEATEventHandler(BaseEventHandler):
         with open(path, "rb") as f:
             return pickle.load(f)
 
-    @staticmethod
-    def save_genome(genome, path):
-        """Save the genome at the specified path."""
-        with open(path, "wb") as f:
-            pickle.dump(genome, f)
+    def record_generation(self, genomes, seed):
+        """Store the fittest genomes of the generation."""
+        if self.store is None:
+            return
 
-    def update_dinosaurs(self, dt):
-        """Update the dinosaurs."""
-        # Handle the collisions and keep track of which dinosaurs collided with an obstacle
-        dinosaurs_to_remove = []
+        genomes = sorted(genomes, key=lambda genome: genome.fitness, reverse=True)
+        self.store.add(self.run_id, self.generation, genomes[:GENOMES_STORED_PER_GENERATION], seed)
 
-        for obstacle in self.obstacles:
-            # Check each dinosaur for collisions
-            for dinosaur in self.dinosaurs:
-                if dinosaur.has_collided(obstacle):
-                    # Add the dinosaur genome to the list of objects to remove
-                    dinosaurs_to_remove.append(dinosaur)
+    def draw(self):
+        """Draw the contents of the game onto the window."""
+        if self.dinosaurs is not None:
+            dinosaurs = self.dinosaurs.get_dinosaurs(self.drawn_dinosaurs)
+            self.renderer.sync(dinosaurs, self.renderer.foreground)
+            self.dinosaur_count_display.set(len(self.dinosaurs))
+            self.more_dinosaurs_display.set(len(self.dinosaurs) - len(dinosaurs))
 
-        # Delete the dinosaurs that collided with an obstacle
-        for dinosaur in dinosaurs_to_remove:
-            dinosaur.delete()
-            self.dinosaurs.remove(dinosaur)
+        self.generation_display.set(self.generation)
+        super().draw()
 
-            # Decrement the number of dinosaurs left and check if any remain
-            self.dinosaur_count_display.increment(-1)
+    def update_dinosaurs(self, dt):
+        """Update the dinosaurs."""
+        # Remove the dinosaurs that collided with an obstacle, only testing the obstacles
+        # that overlap the dinosaurs horizontally
+        x = self.dinosaurs.x
+        self.dinosaurs.collide(self.obstacles.get_range(x, x + Dinosaur.MAX_WIDTH))
 
+        # End the generation once every dinosaur is gone
         if not self.dinosaurs:
             self.reset()
-            pyglet.app.exit()
 
-        next_obstacle = self.obstacles[0] if self.obstacles else None
+            if self.state == self.PLAYING:
+                self.end_generation()
+
+        # The dinosaurs look at the first obstacle that didn't pass them yet
+        next_obstacle = self.obstacles.get_next()
+
+        # Update the dinosaur genomes, which hold their last decisions between two decision steps
+        self.dinosaurs.reward(dt)
 
-        # Update the dinosaur genomes
-        for dinosaur in self.dinosaurs:
-            dinosaur.reward(dt)
-            controller = dinosaur.think(next_obstacle)
-            dinosaur.update(dt, controller)
+        if self.steps_to_decision <= 0:
+            controllers = self.dinosaurs.decide(next_obstacle)
+            self.steps_to_decision = self.decision_steps
+        else:
+            controllers = self.dinosaurs.decisions
+
+        self.steps_to_decision -= 1
+        self.dinosaurs.update(dt, controllers)
 
     def update(self, dt):
-        """Update the objects."""
-        self.update_dinosaurs(dt)
+        """Update the objects, unless the next generation is being bred or the training is over."""
+        if self.state not in (None, self.PLAYING):
+            return
+
         super().update(dt)
 
+    def get_course_seed(self):
+        """Get the seed of the course played by the current generation."""
+        if self.seed is None:
+            return random.randrange(2 ** 32)
+
+        return self.seed
+
+    def start_generation(self):
+        """Start playing the next generation of the population in the window."""
+        self.generation += 1
+        self.genomes = [genome for _, genome in self.population.start_generation()]
+        self.start_time = perf_counter()
+        self.course_seed = self.get_course_seed()
+        genomes = self.lookup_fitness(self.genomes, self.course_seed)
+        self.start_course(genomes, self.population.config, self.course_seed)
+        self.state = self.PLAYING
+
+    def end_generation(self):
+        """Report the generation that was played in the window and breed the next one in the background."""
+        self.report_generation(self.genomes, perf_counter() - self.start_time)
+        self.cache_fitness(self.genomes, self.course_seed)
+        self.record_generation(self.genomes, self.course_seed)
+        self.breeding = self.breeder.submit(self.population.end_generation)
+        self.state = self.BREEDING
+
+        # The frames keep being drawn while checking if the population is bred
+        pyglet.clock.schedule_interval(self.check_breeding, UPDATE_INTERVAL)
+
+    def check_breeding(self, dt):
+        """Start the next generation once it's bred, or stop the event loop after the last generation."""
+        if not self.breeding.done():
+            return
+
+        pyglet.clock.unschedule(self.check_breeding)
+        solved = self.breeding.result()
+        self.breeding = None
+
+        if self.state != self.BREEDING:
+            return  # The window was closed
+
+        if solved or self.generation + 1 >= self.generations:
+            self.state = self.DONE
+            pyglet.app.exit()
+        else:
+            self.start_generation()
+
+    def lookup_fitness(self, genomes, seed):
+        """Reuse the cached fitness values of the genomes on the course of the seed and get the genomes that must play it."""
+        if self.fitness_cache is None:
+            return genomes
+
+        missing = self.fitness_cache.lookup(genomes, seed)
+
+        if len(missing) < len(genomes):
+            print(f"Reused the fitness values of {len(genomes) - len(missing)} genomes that already played this course")
+
+        return missing
+
+    def cache_fitness(self, genomes, seed):
+        """Remember the fitness values of the genomes on the course of the seed."""
+        if self.fitness_cache is not None:
+            self.fitness_cache.add(genomes, seed)
+
+    def report_generation(self, genomes, wall_time):
+        """Show how fast the generation was evaluated."""
+        # The generation lasted as long as its best dinosaur survived
+        simulated_time = max(genome.fitness for genome in genomes)
+
+        if self.profiler is not None:
+            self.profiler.add("generation", wall_time)
+            self.profiler.end_generation(self.generation)
+
+        print(
+            f"Simulated {simulated_time:.1f} seconds in {wall_time:.2f} seconds "
+            f"({simulated_time / wall_time:.1f}x real time)"
+        )
+
     def eval_genomes(self, genomes, config):
-        """Run the game with the NEAT algorithm."""
-        # Terminate if the user closed the window
-        if self.user_exit:
-            exit()
-
-        self.generation_display.increment(1)
-        self.dinosaurs = [
-            DinosaurAI(
-                65,
-                45,
-                genome=genome,
-                config=config,
-                batch=self.batch,
-                group=self.foreground
-            )
-            for _, genome in genomes
-        ]
-
-        pyglet.app.run()
-
-    def reset(self):
-        """Reset the game."""
-        super().reset()
-        self.dinosaur_count_display.set(POPULATION_SIZE)
+        """Evaluate the genomes of a generation without a window."""
+        self.generation += 1
+        genomes = [genome for _, genome in genomes]
+        seed = self.get_course_seed()
+        start_time = perf_counter()
+        missing = self.lookup_fitness(genomes, seed)
+
+        if missing and self.evaluator is not None:
+            self.evaluator.evaluate(missing, config, seed)
+        elif missing:
+            self.simulate(missing, config, seed)
+
+        self.report_generation(genomes, perf_counter() - start_time)
+        self.cache_fitness(genomes, seed)
+        self.record_generation(genomes, seed)
+
+    def start_course(self, genomes, config, seed):
+        """Start the course of the seed with a herd of the genomes."""
+        # Start every generation from the same state so that any process can replay it
+        self.reset()
+        self.schedule(seed)
+        self.dinosaurs = Herd(65, 45, genomes, config)
+        self.steps_to_decision = 0
+
+    def simulate(self, genomes, config, seed):
+        """Let the genomes play the course of the seed without drawing it and set their fitness values."""
+        self.start_course(genomes, config, seed)
+
+        # Step the world at a fixed rate as fast as the CPU allows until every dinosaur
+        # is gone or the survivors reach the fitness threshold
+        elapsed = 0
+
+        while self.dinosaurs and elapsed < config.fitness_threshold:
+            # Nothing can happen to the dinosaurs until an obstacle spawns if none is ahead of them
+            # and they don't hold a decision made while one was
+            if (
+                self.event_driven
+                and self.obstacles.get_next() is None
+                and (self.dinosaurs.decisions is None or self.steps_to_decision <= 0)
+            ):
+                skipped = self.skip(elapsed, config.fitness_threshold)
+
+                if skipped > elapsed:
+                    elapsed = skipped
+                    continue
+
+            self.advance(UPDATE_INTERVAL)
+            elapsed += UPDATE_INTERVAL
+
+        if self.dinosaurs:
+            self.dinosaurs.clear()
+            self.reset()
+
+    def skip(self, elapsed, time_limit):
+        """Skip the updates until the next obstacle spawns (or the time limit is reached) while no obstacle
+        is ahead of the dinosaurs, and get the elapsed time after them. The networks aren't queried and
+        nothing is tested for collisions, but everything that affects the dinosaurs changes at once
+        as if the world had been stepped, so they get the same fitness values up to rounding."""
+        # The obstacles behind the dinosaurs can't collide with them anymore
+        self.obstacles.remove_passed()
+
+        # The world moves in fixed steps (or a step per update without sub-stepping) and each update
+        # carries the time that doesn't fill a whole step over to the next one. Only the updates
+        # whose steps all end before the next obstacle spawns are skipped.
+        step = self.substep or UPDATE_INTERVAL
+        carried = self.accumulated_time if self.substep is not None else 0
+        max_steps = math.ceil(self.next_obstacle_spawn / step) - 1
+        updates = min(
+            math.ceil(((max_steps + 1) * step - carried) / UPDATE_INTERVAL) - 1,
+            math.ceil((time_limit - elapsed) / UPDATE_INTERVAL)
+        )
+        steps = self.count_steps(carried, updates, step)
+
+        while updates > 0 and steps > max_steps:
+            updates -= 1
+            steps = self.count_steps(carried, updates, step)
+
+        if updates <= 0:
+            return elapsed
+
+        if self.substep is not None:
+            self.accumulated_time = carried + updates * UPDATE_INTERVAL - steps * step
+
+        # The networks don't see any obstacle at the decision steps among the skipped ones,
+        # and the steps after the last of them count down to the next decision
+        until_decision = max(self.steps_to_decision, 0)
+
+        if steps > until_decision:
+            self.dinosaurs.decide(None)
+            self.steps_to_decision = self.decision_steps - 1 - (steps - until_decision - 1) % self.decision_steps
+        else:
+            self.steps_to_decision -= steps
+
+        # The timers are counted down by the whole duration. The scenery is left as it is
+        # since nothing draws it without a window.
+        duration = steps * step
+        self.next_obstacle_spawn -= duration
+        self.next_score_increment, points = self.count_down(self.next_score_increment, duration, SCORE_INTERVAL)
+        self.score += points
+        self.next_velocity_increase, increases = self.count_down(self.next_velocity_increase, duration, VELOCITY_INTERVAL)
+        self.increase_velocity(VELOCITY_INCREMENT * increases)
+
+        self.dinosaurs.coast(step, steps)
+        return elapsed + updates * UPDATE_INTERVAL
+
+    @staticmethod
+    def count_steps(carried, updates, step):
+        """Get the number of steps made by updates of the world, starting with the time carried over."""
+        return int((carried + updates * UPDATE_INTERVAL) / step + 1e-9)
+
+    @staticmethod
+    def count_down(timer, duration, interval):
+        """Count a timer that restarts at every interval down by the duration,
+        and get it with the number of times it ran out."""
+        timer -= duration
+
+        # Like in the updates, the timer runs out at whole intervals whatever the rounding
+        if timer > 1e-9:
+            return timer, 0
+
+        times = int((1e-9 - timer) // interval) + 1
+        return timer + times * interval, times
 
     def on_close(self):
         """Close the game."""
         super().on_close()
 
-        for dinosaur in self.dinosaurs:
-            dinosaur.delete()
+        if self.dinosaurs is not None:
+            self.dinosaurs.clear()
+
+        # Stop the training so that no generation is started or bred after the window closes
+        if self.state is not None:
+            self.state = self.DONE
+
+
+def evaluate_genomes(genomes, config, seed):
+    """Evaluate the genomes on the course of the seed without a window and return their fitness values."""
+    game = NEATEventHandler(headless=True)
+    game.simulate(genomes, config, seed)
+    return [genome.fitness for genome in genomes]
@@ -1,21 +1,18 @@
-from pyglet.window import key, mouse
-from ..sprites import Dinosaur
-from ..gui.hud import GameOverDisplay, ResetButton
+from ..world import Dinosaur
 from .base import BaseEventHandler
 import pyglet
 
 
 class PlayerEventHandler(BaseEventHandler):
+    # The dinosaur moves before the rest of the world
+    PHASES = ("update_dinosaurs",) + BaseEventHandler.PHASES
+
     def __init__(self, night_mode=False):
         """Create an event handler that allows the user to play the game manually."""
         super().__init__(night_mode=night_mode)
 
-        # Create a game over group
-        self.game_over_group = pyglet.graphics.OrderedGroup(3)
-        self.game_over_group.visible = False
-
         # Generate the user's dinosaur
-        self.dinosaur = Dinosaur(65, 45, batch=self.batch, group=self.foreground)
+        self.dinosaur = Dinosaur(65, 45)
 
         # Set variables to track user inputs
         self.trigger_duck = False
@@ -24,17 +21,34 @@ class PlayerEventHandler(BaseEventHandler):
         # Keep track of any user collisions
         self.user_collision = False
 
+    def create_view(self, night_mode):
+        """Create the renderer and the HUD that draw the world."""
+        from ..gui.hud import GameOverDisplay, ResetButton
+
+        super().create_view(night_mode)
+
+        # Create a game over group
+        self.game_over_group = pyglet.graphics.OrderedGroup(3)
+        self.game_over_group.visible = False
+
         # Player HUD
-        self.game_over_label = GameOverDisplay(self.batch, self.game_over_group, night_mode)
-        self.reset_button = ResetButton(564, 150, batch=self.batch, group=self.game_over_group)
+        self.game_over_label = GameOverDisplay(self.renderer.batch, self.game_over_group, night_mode)
+        self.reset_button = ResetButton(564, 150, batch=self.renderer.batch, group=self.game_over_group)
 
     @staticmethod
     def run():
         """Run the game."""
         pyglet.app.run()
 
+    @property
+    def finished(self):
+        """Check if the game stopped and there is nothing left to update."""
+        return self.user_collision
+
     def on_key_press(self, symbol, modifiers):
         """Handle the events when a key is pressed."""
+        key = pyglet.window.key
+
         if symbol in (key.DOWN, key.S):
             self.trigger_duck = True
         elif symbol in (key.SPACE, key.UP, key.W):
@@ -46,6 +60,8 @@ class PlayerEventHandler(BaseEventHandler):
 
     def on_key_release(self, symbol, modifiers):
         """Handle the events when a key is released."""
+        key = pyglet.window.key
+
         if symbol in (key.DOWN, key.S):
             self.trigger_duck = False
 
@@ -55,12 +71,19 @@ class PlayerEventHandler(BaseEventHandler):
     def on_mouse_press(self, x, y, button, modifiers):
         """Handle the events when the mouse is pressed."""
         # Handle the left click
-        if button == mouse.LEFT and self.user_collision and self.reset_button.clicked(x, y):
+        if button == pyglet.window.mouse.LEFT and self.user_collision and self.reset_button.clicked(x, y):
             self.reset()
 
+    def draw(self):
+        """Draw the contents of the game onto the window."""
+        self.renderer.sync((self.dinosaur,), self.renderer.foreground)
+        super().draw()
+
     def update_dinosaurs(self, dt):
         """Update the dinosaurs."""
-        for obstacle in self.obstacles:
+        x = self.dinosaur.x
+
+        for obstacle in self.obstacles.get_range(x, x + self.dinosaur.width):
             # Check if the dinosaur collided with any obstacles
             if self.dinosaur.has_collided(obstacle):
                 self.user_collision = True
@@ -76,12 +99,12 @@ class PlayerEventHandler(BaseEventHandler):
         if self.user_collision:
             return
 
-        self.update_dinosaurs(dt)
         super().update(dt)
 
     def reset(self):
         """Reset the game."""
         super().reset()
+        self.schedule()
         self.dinosaur.reset(45)
         self.user_collision = False
         self.game_over_group.visible = False
@@ -0,0 +1,73 @@
+from ..world import Dinosaur, Herd
+from .base import BaseEventHandler
+from ..constants import DRAWN_DINOSAURS
+import pyglet
+
+
+class ReplayEventHandler(BaseEventHandler):
+    # The dinosaurs move before the rest of the world
+    PHASES = ("update_dinosaurs",) + BaseEventHandler.PHASES
+
+    def __init__(self, policy, night_mode=False, headless=False, seed=None):
+        """Create an event handler that lets the networks of a policy play the game over and over."""
+        # Every network of the policy controls its own dinosaur
+        self.policy = policy
+        self.dinosaurs = None
+
+        super().__init__(night_mode=night_mode, headless=headless)
+
+        # Every game plays the course of the seed (or a new random course if not given)
+        self.seed = seed
+        self.games = 0
+
+        self.start_course()
+
+    def create_view(self, night_mode):
+        """Create the renderer and the HUD that draw the world."""
+        from ..gui.hud import DinosaurCountDisplay
+
+        super().create_view(night_mode)
+
+        # Number of dinosaurs label
+        self.dinosaur_count_display = DinosaurCountDisplay(
+            self.renderer.batch,
+            self.renderer.hud,
+            night_mode,
+            len(self.policy)
+        )
+
+    @staticmethod
+    def run():
+        """Run the game."""
+        pyglet.app.run()
+
+    def start_course(self):
+        """Start a new game with a dinosaur per network."""
+        self.reset()
+        self.schedule(self.seed)
+        self.dinosaurs = Herd(65, 45, networks=self.policy)
+
+    def draw(self):
+        """Draw the contents of the game onto the window."""
+        self.renderer.sync(self.dinosaurs.get_dinosaurs(DRAWN_DINOSAURS), self.renderer.foreground)
+        self.dinosaur_count_display.set(len(self.dinosaurs))
+        super().draw()
+
+    def update_dinosaurs(self, dt):
+        """Update the dinosaurs, starting a new game once every one of them is gone."""
+        x = self.dinosaurs.x
+        self.dinosaurs.collide(self.obstacles.get_range(x, x + Dinosaur.MAX_WIDTH))
+
+        if not self.dinosaurs:
+            print(f"Game {self.games}: the last dinosaur survived {self.dinosaurs.fitness.max():.1f} seconds")
+            self.games += 1
+            self.start_course()
+
+        self.dinosaurs.reward(dt)
+        controllers = self.dinosaurs.think(self.obstacles.get_next())
+        self.dinosaurs.update(dt, controllers)
+
+    def on_close(self):
+        """Close the game."""
+        super().on_close()
+        self.dinosaurs.clear()
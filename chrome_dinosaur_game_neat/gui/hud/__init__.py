@@ -2,5 +2,8 @@ from .dinosaur_count_display import DinosaurCountDisplay
 from .fps_display import FPSDisplay
 from .game_over_display import GameOverDisplay
 from .generation_display import GenerationDisplay
+from .more_dinosaurs_display import MoreDinosaursDisplay
+from .profiler_display import ProfilerDisplay
 from .reset_button import ResetButton
 from .score_display import ScoreDisplay
+from .speed_display import SpeedDisplay
@@ -1,11 +1,11 @@
 from pyglet.text import Label
-from ...constants import FONT_NAME, POPULATION_SIZE, WINDOW_HEIGHT
+from ...constants import FONT_NAME, WINDOW_HEIGHT
 
 
 class DinosaurCountDisplay(Label):
-    def __init__(self, batch, group, night_mode=False):
+    def __init__(self, batch, group, night_mode=False, dinosaur_count=0):
         """Create a HUD item that shows the number of dinosaurs."""
-        self.dinosaur_count = POPULATION_SIZE
+        self.dinosaur_count = dinosaur_count
         super().__init__(
             f"DINOSAURS: {self.dinosaur_count:03}",
             font_name=FONT_NAME,
@@ -25,5 +25,7 @@ class DinosaurCountDisplay(Label):
 
     def set(self, value):
         """Set the count to a specific value."""
-        self.dinosaur_count = value
-        self.text = f"DINOSAURS: {self.dinosaur_count:03}"
+        # Only update the text if needed since the label is laid out again
+        if value != self.dinosaur_count:
+            self.dinosaur_count = value
+            self.text = f"DINOSAURS: {self.dinosaur_count:03}"
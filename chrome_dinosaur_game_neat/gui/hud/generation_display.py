@@ -25,5 +25,7 @@ class GenerationDisplay(Label):
 
     def set(self, value):
         """Set the generation number to a specific value."""
-        self.generation_number = value
-        self.text = f"GENERATION: {self.generation_number:02}"
+        # Only update the text if needed since the label is laid out again
+        if value != self.generation_number:
+            self.generation_number = value
+            self.text = f"GENERATION: {self.generation_number:02}"
@@ -0,0 +1,27 @@
+from pyglet.text import Label
+from ...constants import FONT_NAME
+
+
+class MoreDinosaursDisplay(Label):
+    def __init__(self, batch, group, night_mode=False):
+        """Create a HUD item that shows how many alive dinosaurs are not drawn."""
+        self.count = 0
+        super().__init__(
+            "",
+            font_name=FONT_NAME,
+            font_size=12,
+            color=(255, 255, 255, 255) if night_mode else (0, 0, 0, 255),
+            x=65,
+            y=15,
+            anchor_x="left",
+            anchor_y="bottom",
+            batch=batch,
+            group=group
+        )
+
+    def set(self, value):
+        """Set the count to a specific value. Nothing is shown if every dinosaur is drawn."""
+        # Only update the text if needed since the label is laid out again
+        if value != self.count:
+            self.count = value
+            self.text = f"+{self.count} MORE" if self.count else ""
@@ -0,0 +1,28 @@
+from pyglet.text import Label
+from ...constants import WINDOW_WIDTH, FONT_NAME
+
+
+class ProfilerDisplay(Label):
+    def __init__(self):
+        """Create a HUD item that shows the mean time spent in each phase of the game."""
+        super().__init__(
+            "",
+            font_name=FONT_NAME,
+            font_size=8,
+            color=(192, 192, 192, 192),
+            x=WINDOW_WIDTH - 10,
+            y=70,
+            width=400,
+            anchor_x="right",
+            anchor_y="bottom",
+            align="right",
+            multiline=True
+        )
+
+    def set(self, stats):
+        """Set the statistics of the phases, as returned by the profiler."""
+        lines = [
+            f"{phase.replace('update_', '').replace('_', ' ').upper()}: {phase_stats['mean'] * 1e6:.0f}us"
+            for phase, phase_stats in stats.items()
+        ]
+        self.text = "\n".join(lines)
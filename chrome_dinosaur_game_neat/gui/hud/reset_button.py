@@ -1,9 +1,9 @@
 from pyglet.sprite import Sprite as BaseSprite
-from ...utils import get_sprite_map
+from ...utils import LazyAsset, get_sprite_map
 
 
 class ResetButton(BaseSprite):
-    IMAGES = [get_sprite_map().get_region(2, 63, 72, 65)]
+    IMAGES = LazyAsset(lambda: [get_sprite_map().get_region(2, 63, 72, 65)])
 
     def __init__(self, *args, **kwargs):
         """Create a Reset button."""
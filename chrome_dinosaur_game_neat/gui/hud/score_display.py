@@ -25,5 +25,7 @@ class ScoreDisplay(Label):
 
     def set(self, value):
         """Set the score to a specific value."""
-        self.score = value
-        self.text = f"{self.score:05}"
+        # Only update the text if needed since the label is laid out again
+        if value != self.score:
+            self.score = value
+            self.text = f"{self.score:05}"
@@ -0,0 +1,22 @@
+from pyglet.text import Label
+from ...constants import WINDOW_WIDTH, FONT_NAME
+
+
+class SpeedDisplay(Label):
+    def __init__(self):
+        """Create a HUD item that shows the simulated seconds per wall-clock second."""
+        self.speed = 0
+        super().__init__(
+            f"SPEED: {self.speed:.1f}x",
+            font_name=FONT_NAME,
+            font_size=20,
+            color=(192, 192, 192, 192),
+            x=WINDOW_WIDTH - 10,
+            y=40,
+            anchor_x="right"
+        )
+
+    def set(self, value):
+        """Set the speed to a specific value."""
+        self.speed = value
+        self.text = f"SPEED: {self.speed:.1f}x"
@@ -0,0 +1,62 @@
+import pyglet
+from collections import defaultdict
+from .. import sprites, world
+from ..utils import load_font
+
+
+class Renderer:
+    # Sprites used to draw each type of entity
+    SPRITES = {
+        world.Bird: sprites.Bird,
+        world.Cactus: sprites.Cactus,
+        world.Cloud: sprites.Cloud,
+        world.Dinosaur: sprites.Dinosaur,
+        world.DinosaurAI: sprites.Dinosaur,
+        world.Moon: sprites.Moon,
+        world.Star: sprites.Star,
+        world.Terrain: sprites.Terrain
+    }
+
+    def __init__(self):
+        """Create a renderer that draws the game world with pyglet sprites."""
+        # Generate the font style used by the HUD
+        load_font()
+
+        # Create batches and groups
+        self.batch = pyglet.graphics.Batch()
+        self.background = pyglet.graphics.OrderedGroup(0)
+        self.foreground = pyglet.graphics.OrderedGroup(1)
+        self.hud = pyglet.graphics.OrderedGroup(2)
+
+        # Hidden sprites waiting to be reused, by sprite class and group
+        self.pools = defaultdict(list)
+
+    def create_sprite(self, entity, group):
+        """Get a sprite drawing the entity, reusing a released one if possible."""
+        sprite_class = self.SPRITES[type(entity)]
+
+        if not sprite_class.POOLED:
+            return sprite_class(entity, batch=self.batch, group=group)
+
+        pool = self.pools[sprite_class, group]
+
+        if pool:
+            sprite = pool.pop()
+            sprite.bind(entity)
+        else:
+            sprite = sprite_class(entity, batch=self.batch, group=group)
+            sprite.pool = pool
+
+        return sprite
+
+    def sync(self, entities, group):
+        """Create or move the sprites of the entities."""
+        for entity in entities:
+            if entity.sprite is None:
+                entity.sprite = self.create_sprite(entity, group)
+            else:
+                entity.sprite.sync()
+
+    def draw(self):
+        """Draw the sprites and the HUD."""
+        self.batch.draw()
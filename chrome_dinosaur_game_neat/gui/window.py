@@ -1,13 +1,30 @@
 import pyglet
 from pyglet.window import key, Window as BaseWindow
-from .hud import FPSDisplay
-from ..event_handlers import PlayerEventHandler, NEATEventHandler
-from ..constants import WINDOW_WIDTH, WINDOW_HEIGHT, FONT_FILE_NAME, FONT_NAME
+from time import perf_counter
+from .hud import FPSDisplay, ProfilerDisplay, SpeedDisplay
+from ..event_handlers import PlayerEventHandler
+from ..timing import SpeedMeter
+from ..constants import (
+    WINDOW_WIDTH,
+    WINDOW_HEIGHT,
+    DRAW_INTERVAL,
+    TURBO_FRAME_BUDGET,
+    UPDATE_INTERVAL
+)
 
 
 class Window(BaseWindow):
-    def __init__(self, enable_neat=False, night_mode=False, *args, **kwargs):
-        """Create a window."""
+    def __init__(
+        self,
+        game_type=PlayerEventHandler,
+        game_options=None,
+        night_mode=False,
+        turbo=False,
+        profiler=None,
+        *args,
+        **kwargs
+    ):
+        """Create a window that runs a game of the event handler type, created with the options."""
         super().__init__(
             caption="Google Chrome Dinosaur Game (with NEAT)",
             width=WINDOW_WIDTH,
@@ -20,19 +37,31 @@ class Window(BaseWindow):
         if not night_mode:
             pyglet.gl.glClearColor(1, 1, 1, 1)
 
-        # Generate the font style
-        pyglet.font.add_file(FONT_FILE_NAME)
-        pyglet.font.load(FONT_NAME)
-
         # Create the game event handler
-        if enable_neat:
-            self.game = NEATEventHandler(night_mode=night_mode)
-        else:
-            self.game = PlayerEventHandler(night_mode=night_mode)
+        self.game = game_type(night_mode=night_mode, **(game_options or {}))
 
         # Set and draw the FPS display
         self.fps_display = FPSDisplay(self)
-        pyglet.clock.schedule_interval(self.update, 1/60)
+
+        # pyglet draws a frame after each update, so the updates are scheduled at the draw rate.
+        # The game itself advances in fixed steps that don't depend on it.
+        pyglet.clock.schedule_interval(self.update, DRAW_INTERVAL)
+
+        # In turbo mode, step the game as many times as possible per frame and show the speed
+        self.turbo = turbo
+
+        if turbo:
+            self.speed_meter = SpeedMeter()
+            self.speed_display = SpeedDisplay()
+            pyglet.clock.schedule_interval(self.update_speed, 0.5)
+
+        # If a profiler is given, time the phases of the game and the drawing and show the timings
+        self.profiler = profiler
+
+        if profiler is not None:
+            self.game.enable_profiling(profiler)
+            self.profiler_display = ProfilerDisplay()
+            pyglet.clock.schedule_interval(self.update_profiler, 0.5)
 
     def run(self):
         """Run the window."""
@@ -57,14 +86,47 @@ class Window(BaseWindow):
     def on_draw(self):
         """Draw the contents on the screen."""
         self.clear()  # Clear the screen
-        self.game.draw()
+
+        if self.profiler is None:
+            self.game.draw()
+        else:
+            start = perf_counter()
+            self.game.draw()
+            self.profiler.add("draw", perf_counter() - start)
+            self.profiler_display.draw()
+
         self.fps_display.draw()
 
+        if self.turbo:
+            self.speed_display.draw()
+
     def update(self, dt):
         """Update the game."""
-        self.game.update(dt)
+        if not self.turbo:
+            self.game.advance(dt)
+            return
+
+        # Step the game with a fixed timestep until the time budget of the frame is spent
+        deadline = perf_counter() + TURBO_FRAME_BUDGET
+
+        while perf_counter() < deadline and not self.game.finished:
+            self.game.advance(UPDATE_INTERVAL)
+            self.speed_meter.add(UPDATE_INTERVAL)
+
+    def update_speed(self, dt):
+        """Update the speed display."""
+        self.speed_display.set(self.speed_meter.read())
+
+    def update_profiler(self, dt):
+        """Update the profiler display and dump the timings if it's time to."""
+        self.profiler_display.set(self.profiler.get_stats())
+        self.profiler.dump()
 
     def on_close(self):
         """Terminate the game if the window is closed."""
         self.game.on_close()
+
+        if self.profiler is not None:
+            self.profiler.dump(force=True)
+
         super().on_close()
@@ -0,0 +1,64 @@
+from collections import OrderedDict
+import hashlib
+
+
+class FitnessCache:
+    def __init__(self, size=10000):
+        """Create a cache of the fitness values of genomes on the courses they played.
+        Only the most recently used entries are kept once the size is reached."""
+        self.size = size
+        self.entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        """Get the number of cached fitness values."""
+        return len(self.entries)
+
+    @staticmethod
+    def hash_genome(genome):
+        """Get a digest of everything that affects the network of a genome."""
+        nodes = tuple(
+            (key, node.bias, node.response, node.activation, node.aggregation)
+            for key, node in sorted(genome.nodes.items())
+        )
+        connections = tuple(
+            (key, connection.weight)
+            for key, connection in sorted(genome.connections.items())
+            if connection.enabled
+        )
+        return hashlib.blake2b(repr((nodes, connections)).encode(), digest_size=16).digest()
+
+    def lookup(self, genomes, seed):
+        """Set the fitness values of the genomes that already played the course of the seed
+        and get the genomes that still need to play it."""
+        missing = []
+
+        for genome in genomes:
+            key = (self.hash_genome(genome), seed)
+            fitness = self.entries.get(key)
+
+            if fitness is None:
+                missing.append(genome)
+            else:
+                genome.fitness = fitness
+                self.entries.move_to_end(key)
+
+        self.hits += len(genomes) - len(missing)
+        self.misses += len(missing)
+        return missing
+
+    def add(self, genomes, seed):
+        """Cache the fitness values the genomes got on the course of the seed."""
+        for genome in genomes:
+            key = (self.hash_genome(genome), seed)
+            self.entries[key] = genome.fitness
+            self.entries.move_to_end(key)
+
+        # Forget the least recently used entries
+        while len(self.entries) > self.size:
+            self.entries.popitem(last=False)
+
+    def clear(self):
+        """Forget every cached fitness value."""
+        self.entries.clear()
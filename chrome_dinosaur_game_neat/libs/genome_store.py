@@ -0,0 +1,108 @@
+from time import time
+import pickle
+import sqlite3
+import zlib
+
+
+class GenomeStore:
+    # Columns describing a stored genome, without its data
+    COLUMNS = "id, run_id, generation, genome_key, fitness, seed"
+
+    def __init__(self, path):
+        """Open (or create) a database of the best genomes of every generation of every training run."""
+        self.connection = sqlite3.connect(path)
+        self.connection.row_factory = sqlite3.Row
+
+        # Let readers query the store while a training run writes to it
+        self.connection.execute("PRAGMA journal_mode = WAL")
+
+        with self.connection:
+            self.connection.executescript("""
+                CREATE TABLE IF NOT EXISTS runs (
+                    id INTEGER PRIMARY KEY,
+                    started REAL NOT NULL
+                );
+                CREATE TABLE IF NOT EXISTS genomes (
+                    id INTEGER PRIMARY KEY,
+                    run_id INTEGER NOT NULL REFERENCES runs (id),
+                    generation INTEGER NOT NULL,
+                    genome_key INTEGER NOT NULL,
+                    fitness REAL NOT NULL,
+                    seed INTEGER,
+                    data BLOB NOT NULL
+                );
+                CREATE INDEX IF NOT EXISTS genomes_by_fitness ON genomes (fitness DESC);
+                CREATE INDEX IF NOT EXISTS genomes_by_run ON genomes (run_id, generation, fitness DESC);
+                CREATE INDEX IF NOT EXISTS genomes_by_seed ON genomes (seed, fitness DESC);
+            """)
+
+    def __len__(self):
+        """Get the number of stored genomes."""
+        return self.connection.execute("SELECT COUNT(*) FROM genomes").fetchone()[0]
+
+    def start_run(self):
+        """Record the start of a training run and get its ID."""
+        with self.connection:
+            return self.connection.execute("INSERT INTO runs (started) VALUES (?)", (time(),)).lastrowid
+
+    def add(self, run_id, generation, genomes, seed=None):
+        """Store the genomes evaluated by a generation of the run on the course of the seed."""
+        rows = [
+            (run_id, generation, genome.key, genome.fitness, seed, self.serialize(genome))
+            for genome in genomes
+        ]
+
+        with self.connection:
+            self.connection.executemany(
+                "INSERT INTO genomes (run_id, generation, genome_key, fitness, seed, data) VALUES (?, ?, ?, ?, ?, ?)",
+                rows
+            )
+
+    def get_best(self, limit=10, run_id=None, generation=None, seed=None):
+        """Get the rows of the fittest genomes, optionally only those of a run, a generation or a seed."""
+        conditions = []
+        parameters = []
+
+        for column, value in (("run_id", run_id), ("generation", generation), ("seed", seed)):
+            if value is not None:
+                conditions.append(f"{column} = ?")
+                parameters.append(value)
+
+        where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+        return self.connection.execute(
+            f"SELECT {self.COLUMNS} FROM genomes {where} ORDER BY fitness DESC LIMIT ?",
+            (*parameters, limit)
+        ).fetchall()
+
+    def load(self, genome_id):
+        """Load the stored genome with the ID."""
+        row = self.connection.execute("SELECT data FROM genomes WHERE id = ?", (genome_id,)).fetchone()
+
+        if row is None:
+            raise KeyError(genome_id)
+
+        return self.deserialize(row["data"])
+
+    def load_best(self, seed=None):
+        """Load the fittest genome evaluated on a known course (the course of the seed if one is given), if any.
+        Genomes stored without a seed, like imported ones, were evaluated by other versions of the game."""
+        condition, parameters = ("seed = ?", (seed,)) if seed is not None else ("seed IS NOT NULL", ())
+        row = self.connection.execute(
+            f"SELECT id FROM genomes WHERE {condition} ORDER BY fitness DESC LIMIT 1",
+            parameters
+        ).fetchone()
+        return self.load(row["id"]) if row is not None else None
+
+    @staticmethod
+    def serialize(genome):
+        """Convert a genome to compressed bytes."""
+        return zlib.compress(pickle.dumps(genome, pickle.HIGHEST_PROTOCOL))
+
+    @staticmethod
+    def deserialize(data):
+        """Convert compressed bytes back to a genome."""
+        return pickle.loads(zlib.decompress(data))
+
+    def close(self):
+        """Close the database."""
+        self.connection.close()
@@ -5,25 +5,829 @@ from neat import (
     DefaultSpeciesSet,
     DefaultStagnation,
     Population as BasePopulation,
-    StatisticsReporter,
     StdOutReporter
 )
+from neat.graphs import feed_forward_layers
+from neat.population import CompleteExtinctionException
+from neat.reporting import BaseReporter
+from .policy import Policy
+from .species_set import SpeciesSet
+from ..constants import NEAT_CONFIG_FILE_NAME
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from itertools import count
+from multiprocessing import AuthenticationError, Pipe, Pool, Process
+from multiprocessing.connection import Client, Listener, wait
+from queue import Queue
+from threading import Thread
+from time import perf_counter, sleep, time
+import numpy as np
+import csv
+import gzip
+import ipaddress
+import json
 import os
+import pickle
+import random
+import secrets
+import socket
+import re
+
+
+def load_config(overrides=None, config_file=NEAT_CONFIG_FILE_NAME):
+    """Load the NEAT configuration of the game from the file, replacing the settings given in the overrides."""
+    config = Config(
+        DefaultGenome,
+        DefaultReproduction,
+        DefaultSpeciesSet,
+        DefaultStagnation,
+        config_file
+    )
+
+    # The species are found by a faster species set that reads the same section of the file
+    config.species_set_type = SpeciesSet
+
+    # Every setting belongs to the section of the file it's read from
+    sections = (
+        config,
+        config.genome_config,
+        config.species_set_config,
+        config.stagnation_config,
+        config.reproduction_config
+    )
+
+    for name, value in (overrides or {}).items():
+        section = next((section for section in sections if hasattr(section, name)), None)
+
+        if section is None:
+            raise KeyError(f"Unknown NEAT setting: {name}")
+
+        setattr(section, name, value)
+
+    return config
+
+
+def list_checkpoints(directory):
+    """Get the paths of the checkpoints in the directory, from the oldest generation to the latest."""
+    if not os.path.isdir(directory):
+        return []
+
+    checkpoints = []
+
+    for file_name in os.listdir(directory):
+        match = re.fullmatch(r"checkpoint-(\d+)\.pkl\.gz", file_name)
+
+        if match:
+            checkpoints.append((int(match.group(1)), os.path.join(directory, file_name)))
+
+    return [path for _, path in sorted(checkpoints)]
+
+
+def finish(future):
+    """Check if the work of a future is done, raising the error it ran into if any."""
+    if not future.done():
+        return False
+
+    future.result()
+    return True
+
+
+def load_checkpoint(path):
+    """Load the state of the evolution saved in a checkpoint."""
+    with gzip.open(path, "rb") as f:
+        return pickle.load(f)
 
 
 class Population(BasePopulation):
-    def __init__(self):
-        """Create a NEAT population object."""
-        config_file = os.path.abspath("chrome_dinosaur_game_neat/neat_config.txt")
-        config = Config(
-            DefaultGenome,
-            DefaultReproduction,
-            DefaultSpeciesSet,
-            DefaultStagnation,
-            config_file
+    def __init__(self, checkpoint=None, overrides=None, verbose=True, config_file=NEAT_CONFIG_FILE_NAME):
+        """Create a NEAT population object, resuming the evolution saved in the checkpoint if given."""
+        super().__init__(load_config(overrides, config_file))
+
+        if checkpoint is not None:
+            self.set_state(load_checkpoint(checkpoint))
+
+        # Genomes from other populations that join the next generation
+        self.immigrants = []
+
+        # Add a reporter to show progress in the terminal
+        if verbose:
+            self.add_reporter(StdOutReporter(True))
+
+    def get_state(self):
+        """Get everything needed to resume the evolution from the current generation."""
+        # Counters can't be copied, so they are read and started again from the same value
+        species_key = next(self.species.indexer)
+        self.species.indexer = count(species_key)
+        genome_key = next(self.reproduction.genome_indexer)
+        self.reproduction.genome_indexer = count(genome_key)
+
+        return {
+            "generation": self.generation,
+            "population": self.population,
+            "species": self.species.species,
+            "genome_to_species": self.species.genome_to_species,
+            "next_species_key": species_key,
+            "next_genome_key": genome_key,
+            "ancestors": self.reproduction.ancestors,
+            "best_genome": self.best_genome,
+            "random_state": random.getstate()
+        }
+
+    def set_state(self, state):
+        """Resume the evolution from a state."""
+        self.generation = state["generation"]
+        self.population = state["population"]
+        self.species.species = state["species"]
+        self.species.genome_to_species = state["genome_to_species"]
+        self.species.indexer = count(state["next_species_key"])
+        self.reproduction.genome_indexer = count(state["next_genome_key"])
+        self.reproduction.ancestors = state["ancestors"]
+        self.best_genome = state["best_genome"]
+
+        # NEAT draws from the random module, so it continues from where it was
+        random.setstate(state["random_state"])
+
+    def start_generation(self):
+        """Start a generation and get the (genome id, genome) pairs to evaluate."""
+        self.reporters.start_generation(self.generation)
+        return list(self.population.items())
+
+    def end_generation(self):
+        """Report the evaluated generation and create the next one. Return True if a solution was found."""
+        best = max(self.population.values(), key=lambda genome: genome.fitness)
+        self.reporters.post_evaluate(self.config, self.population, self.species, best)
+
+        # Track the best genome ever seen
+        if self.best_genome is None or best.fitness > self.best_genome.fitness:
+            self.best_genome = best
+
+        # End if the fitness threshold is reached
+        if not self.config.no_fitness_termination:
+            fitness = self.fitness_criterion(genome.fitness for genome in self.population.values())
+
+            if fitness >= self.config.fitness_threshold:
+                self.reporters.found_solution(self.config, self.generation, best)
+                return True
+
+        # Create the next generation from the current generation
+        self.population = self.reproduction.reproduce(
+            self.config,
+            self.species,
+            self.config.pop_size,
+            self.generation
+        )
+        self.reporters.post_reproduction(self.config, self.population, self.species)
+
+        # Start over with a new population after a complete extinction if requested
+        if not self.species.species:
+            self.reporters.complete_extinction()
+
+            if not self.config.reset_on_extinction:
+                raise CompleteExtinctionException()
+
+            self.population = self.reproduction.create_new(
+                self.config.genome_type,
+                self.config.genome_config,
+                self.config.pop_size
+            )
+
+        # Let the genomes received from other populations take the place of offspring
+        self.settle_immigrants()
+
+        # Divide the new population into species
+        self.species.speciate(self.config, self.population, self.generation)
+        self.reporters.end_generation(self.config, self.population, self.species)
+        self.generation += 1
+        return False
+
+    def settle_immigrants(self):
+        """Replace the newest offspring of the population with the immigrants."""
+        if not self.immigrants:
+            return
+
+        # The immigrants keep the node keys of their own population, so new nodes are numbered after
+        # the largest of them for the mutations not to give a genome a key it already has
+        genome_config = self.config.genome_config
+        largest_key = max(key for genome in self.immigrants + list(self.population.values()) for key in genome.nodes)
+
+        if genome_config.node_indexer is not None:
+            largest_key = max(largest_key, next(genome_config.node_indexer) - 1)
+
+        genome_config.node_indexer = count(largest_key + 1)
+
+        # The elites keep their keys, so the newest keys always belong to offspring
+        newest = sorted(self.population, reverse=True)[:len(self.immigrants)]
+
+        for key, genome in zip(newest, self.immigrants):
+            genome.key = key
+            genome.fitness = None
+            self.population[key] = genome
+            self.reproduction.ancestors[key] = ()
+
+        self.immigrants = []
+
+    def run(self, fitness_function, n=None):
+        """Evaluate the generations with the fitness function until a solution is found
+        or n generations are evaluated, and get the best genome."""
+        if self.config.no_fitness_termination and n is None:
+            raise RuntimeError("Cannot have no generational limit with no fitness termination")
+
+        generations = 0
+
+        while n is None or generations < n:
+            generations += 1
+            fitness_function(self.start_generation(), self.config)
+
+            if self.end_generation():
+                break
+
+        if self.config.no_fitness_termination:
+            self.reporters.found_solution(self.config, self.generation, self.best_genome)
+
+        return self.best_genome
+
+
+class ParallelEvaluator:
+    def __init__(self, eval_function, num_workers=None):
+        """Create an evaluator that splits the genomes of each generation across worker processes."""
+        # The evaluation function receives (genomes, config, seed) and returns their fitness values
+        self.eval_function = eval_function
+        self.num_workers = num_workers or os.cpu_count()
+        self.pool = Pool(self.num_workers)
+
+    def evaluate(self, genomes, config, seed):
+        """Evaluate the genomes on the course of the seed and set their fitness values."""
+        chunk_size = -(-len(genomes) // self.num_workers)  # Round up
+        chunks = [genomes[i:i + chunk_size] for i in range(0, len(genomes), chunk_size)]
+        results = self.pool.starmap(self.eval_function, [(chunk, config, seed) for chunk in chunks])
+
+        for chunk, fitnesses in zip(chunks, results):
+            for genome, fitness in zip(chunk, fitnesses):
+                genome.fitness = fitness
+
+    def close(self):
+        """Stop the worker processes."""
+        self.pool.close()
+        self.pool.join()
+
+
+class DistributedEvaluator:
+    def __init__(self, address, authkey, batch_size=25, timeout=60):
+        """Create an evaluator that sends batches of genomes to the workers connected to the address,
+        possibly from other machines. The batch of a worker that doesn't answer in time is sent to another."""
+        self.address = address
+        self.batch_size = batch_size
+        self.timeout = timeout
+
+        # Workers are accepted in the background, even while a generation is evaluated
+        self.listener = Listener(address, authkey=authkey)
+        self.connected = Queue()
+        self.workers = []
+        self.accepter = Thread(target=self.accept, daemon=True)
+        self.accepter.start()
+
+    def accept(self):
+        """Accept the workers that connect until the evaluator is closed."""
+        while True:
+            try:
+                self.connected.put(self.listener.accept())
+            except AuthenticationError:
+                continue  # Ignore the clients that don't know the key
+            except OSError:
+                return  # The listener was closed
+
+    def evaluate(self, genomes, config, seed):
+        """Evaluate the genomes on the course of the seed and set their fitness values."""
+        batches = [genomes[i:i + self.batch_size] for i in range(0, len(genomes), self.batch_size)]
+        pending = deque(range(len(batches)))
+        assigned = {}  # Connection of a busy worker -> (batch index, deadline)
+        waiting = False
+
+        while pending or assigned:
+            while not self.connected.empty():
+                self.workers.append(self.connected.get())
+
+            # Hand out the pending batches to the idle workers
+            idle = [worker for worker in self.workers if worker not in assigned]
+
+            while pending and idle:
+                worker = idle.pop()
+                index = pending.popleft()
+
+                try:
+                    worker.send((index, batches[index], config, seed))
+                except OSError:
+                    self.drop(worker)
+                    pending.appendleft(index)
+                    continue
+
+                assigned[worker] = (index, perf_counter() + self.timeout)
+
+            if pending and not self.workers and not waiting:
+                print(f"Waiting for workers to connect to {self.address[0]}:{self.address[1]}...")
+                waiting = True
+
+            # Collect the fitness values of the batches that are done
+            for worker in wait(list(assigned), timeout=0.1):
+                index, _ = assigned.pop(worker)
+
+                try:
+                    _, fitnesses = worker.recv()
+                except (EOFError, OSError):
+                    self.drop(worker)
+                    pending.append(index)
+                    continue
+
+                for genome, fitness in zip(batches[index], fitnesses):
+                    genome.fitness = fitness
+
+            # Give the batches of the workers that timed out to other workers
+            now = perf_counter()
+
+            for worker, (index, deadline) in list(assigned.items()):
+                if now > deadline:
+                    print(f"A worker didn't evaluate its batch in {self.timeout} seconds, reassigning it")
+                    del assigned[worker]
+                    self.drop(worker)
+                    pending.append(index)
+
+    def drop(self, worker):
+        """Disconnect a worker."""
+        self.workers.remove(worker)
+        worker.close()
+
+    def close(self):
+        """Tell the workers to stop and stop accepting new ones."""
+        self.listener.close()
+
+        while not self.connected.empty():
+            self.workers.append(self.connected.get())
+
+        for worker in self.workers:
+            try:
+                worker.send(None)
+            except OSError:
+                pass
+
+            worker.close()
+
+        self.workers = []
+
+
+def is_loopback(host):
+    """Check if a host name or IP address only refers to this machine."""
+    try:
+        return ipaddress.ip_address(host).is_loopback
+    except ValueError:
+        pass
+
+    try:
+        return ipaddress.ip_address(socket.gethostbyname(host)).is_loopback
+    except OSError:
+        return False
+
+
+def create_authkey(path):
+    """Generate a random key and write it to a file that only the current user can read."""
+    authkey = secrets.token_hex(32)
+
+    # A file left by another run (or another user) is replaced, never reused with its permissions
+    if os.path.lexists(path):
+        os.remove(path)
+
+    with os.fdopen(os.open(path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600), "w") as f:
+        f.write(authkey)
+
+    return authkey
+
+
+def read_authkey(path):
+    """Read the key written by create_authkey, making sure that no other user could have written or read it."""
+    with open(path) as f:
+        status = os.fstat(f.fileno())
+
+        if status.st_uid != os.getuid() or status.st_mode & 0o077:
+            raise PermissionError(f"{path} must belong to the current user and only be readable by them")
+
+        return f.read()
+
+
+def run_worker(address, authkey, eval_function, retry_interval=1):
+    """Evaluate the batches of genomes sent by the evaluator at the address until it stops,
+    waiting for it to start if needed. The evaluation function receives (genomes, config, seed)."""
+    while True:
+        try:
+            connection = Client(address, authkey=authkey)
+        except ConnectionRefusedError:
+            sleep(retry_interval)
+            continue
+
+        with connection:
+            try:
+                while True:
+                    task = connection.recv()
+
+                    if task is None:
+                        return  # The evaluator stopped
+
+                    index, genomes, config, seed = task
+                    connection.send((index, eval_function(genomes, config, seed)))
+            except (EOFError, OSError):
+                # The evaluator dropped this worker (e.g. it answered too late) or restarted, so connect again
+                continue
+
+
+class IslandModel:
+    # Ways the islands send their migrants: to the next island only, or to every other island
+    TOPOLOGIES = ("ring", "full")
+
+    def __init__(
+        self,
+        eval_function,
+        islands,
+        interval=5,
+        migrants=2,
+        topology="ring",
+        reported=5,
+        config_file=NEAT_CONFIG_FILE_NAME
+    ):
+        """Create a model that evolves a population per island, each in its own process. The islands are
+        given as (config overrides, seed) pairs, and every few generations the fittest genomes of each island
+        migrate to its neighbours in the topology."""
+        if topology not in self.TOPOLOGIES:
+            raise ValueError(f"Unknown topology: {topology}")
+
+        # The evaluation function receives (genomes, config, seed) and returns their fitness values
+        self.eval_function = eval_function
+        self.islands = islands
+        self.interval = interval
+        self.migrants = migrants
+        self.topology = topology
+
+        # Number of the fittest genomes of every generation sent back to be reported
+        self.reported = reported
+
+        # Every island reads the same config file before replacing its own settings
+        self.config_file = config_file
+
+    def run(self, generations, course_seed=None, on_generation=None):
+        """Evolve the islands for the number of generations and get the best genome found by any of them.
+        After every generation of an island, the function receives (island, generation, fittest genomes,
+        course seed, wall time)."""
+        connections = []
+        processes = []
+
+        for overrides, seed in self.islands:
+            connection, island_connection = Pipe()
+            process = Process(
+                target=run_island,
+                args=(
+                    island_connection,
+                    overrides,
+                    seed,
+                    course_seed,
+                    generations,
+                    self.interval,
+                    self.migrants,
+                    self.reported,
+                    self.eval_function,
+                    self.config_file
+                ),
+                daemon=True
+            )
+            process.start()
+            island_connection.close()
+            connections.append(connection)
+            processes.append(process)
+
+        best_genomes = []
+        active = set(range(len(self.islands)))
+        migrants = {}
+
+        try:
+            while active:
+                for connection in wait([connections[index] for index in active]):
+                    index = connections.index(connection)
+
+                    try:
+                        kind, payload = connection.recv()
+                    except EOFError:
+                        raise RuntimeError(f"Island {index} stopped unexpectedly") from None
+
+                    if kind == "generation":
+                        if on_generation is not None:
+                            on_generation(index, *payload)
+                    elif kind == "migrants":
+                        migrants[index] = payload
+                    else:
+                        best_genomes.append(payload)
+                        active.discard(index)
+
+                # Exchange the migrants once every island that is still evolving sent its own
+                if migrants and migrants.keys() == active:
+                    self.migrate(migrants, connections)
+                    migrants = {}
+        except BaseException:
+            for process in processes:
+                process.terminate()
+
+            raise
+        finally:
+            for process in processes:
+                process.join()
+
+            for connection in connections:
+                connection.close()
+
+        return max(best_genomes, key=lambda genome: genome.fitness)
+
+    def migrate(self, migrants, connections):
+        """Send the migrants of every island to its neighbours."""
+        indices = sorted(migrants)
+
+        for position, index in enumerate(indices):
+            if self.topology == "ring":
+                sources = [indices[position - 1]] if len(indices) > 1 else []
+            else:
+                sources = [source for source in indices if source != index]
+
+            connections[index].send([genome for source in sources for genome in migrants[source]])
+
+
+def run_island(
+    connection,
+    overrides,
+    seed,
+    course_seed,
+    generations,
+    interval,
+    migrants,
+    reported,
+    eval_function,
+    config_file=NEAT_CONFIG_FILE_NAME
+):
+    """Evolve the population of an island, reporting every generation through the connection and
+    exchanging migrants with the other islands every interval generations."""
+    # Every island breeds its own population and plays its own courses
+    random.seed(seed)
+    courses = random.Random(seed)
+    population = Population(overrides=overrides, verbose=False, config_file=config_file)
+
+    with connection:
+        for _ in range(generations):
+            generation = population.generation
+            genomes = [genome for _, genome in population.start_generation()]
+            course = course_seed if course_seed is not None else courses.randrange(2 ** 32)
+            start_time = perf_counter()
+
+            for genome, fitness in zip(genomes, eval_function(genomes, population.config, course)):
+                genome.fitness = fitness
+
+            genomes.sort(key=lambda genome: genome.fitness, reverse=True)
+            connection.send(("generation", (generation, genomes[:reported], course, perf_counter() - start_time)))
+
+            # Trade the champions for those of the neighbours before breeding the next generation
+            if (generation + 1) % interval == 0 and generation + 1 < generations:
+                connection.send(("migrants", genomes[:migrants]))
+                population.immigrants = connection.recv()
+
+            if population.end_generation():
+                break
+
+        connection.send(("done", population.best_genome))
+
+
+class Checkpointer(BaseReporter):
+    def __init__(self, population, directory, interval=1, keep=3):
+        """Create a reporter that saves compressed checkpoints of the population every few generations.
+        The checkpoints are written by a background thread and only the latest few are kept."""
+        self.population = population
+        self.directory = directory
+        self.interval = interval
+        self.keep = keep
+        self.writer = ThreadPoolExecutor(max_workers=1)
+        self.writes = []
+
+    def start_generation(self, generation):
+        """Save the population before the generation is evaluated, if it's time to."""
+        if generation % self.interval:
+            return
+
+        # Pickle the state right away so that the evolution can go on while it's written
+        data = pickle.dumps(self.population.get_state(), pickle.HIGHEST_PROTOCOL)
+        path = os.path.join(self.directory, f"checkpoint-{generation}.pkl.gz")
+        self.writes = [write for write in self.writes if not finish(write)]
+        self.writes.append(self.writer.submit(self.write, data, path))
+
+    def write(self, data, path):
+        """Compress and write a checkpoint, then delete the oldest ones."""
+        os.makedirs(self.directory, exist_ok=True)
+
+        # Replace the file at once so that a crash never leaves a partial checkpoint
+        temporary_path = f"{path}.tmp"
+
+        with open(temporary_path, "wb") as f:
+            f.write(gzip.compress(data, compresslevel=5))
+
+        os.replace(temporary_path, path)
+
+        for old_path in list_checkpoints(self.directory)[:-self.keep]:
+            os.remove(old_path)
+
+    def close(self):
+        """Wait for the checkpoints being written, raising any error that occurred."""
+        self.writer.shutdown()
+
+        for write in self.writes:
+            write.result()
+
+
+class StreamingReporter(BaseReporter):
+    # Columns of the rows written for every generation
+    FIELDS = (
+        "generation",
+        "timestamp",
+        "population",
+        "species",
+        "best_genome",
+        "best_fitness",
+        "mean_fitness",
+        "stdev_fitness",
+        "min_fitness",
+        "evaluation_time",
+        "reproduction_time",
+        "speciation_time"
+    )
+
+    def __init__(self, path, window=100):
+        """Create a reporter that appends a summary row of every generation to a CSV or JSON lines file
+        (depending on the extension of the path) from a background thread.
+        Only the rows of the latest generations are kept in memory."""
+        self.path = path
+        self.rows = deque(maxlen=window)
+        self.writer = ThreadPoolExecutor(max_workers=1)
+        self.writes = []
+        self.file = None
+        self.csv_writer = None
+
+        # Row of the generation being reported and when its current step started
+        self.row = None
+        self.step_start_time = perf_counter()
+
+    def start_generation(self, generation):
+        """Start timing the evaluation of the generation."""
+        self.row = dict.fromkeys(self.FIELDS)
+        self.row["generation"] = generation
+        self.step_start_time = perf_counter()
+
+    def post_evaluate(self, config, population, species, best_genome):
+        """Summarize the fitness values of the evaluated generation."""
+        now = perf_counter()
+        fitnesses = np.array([genome.fitness for genome in population.values()])
+        self.row.update(
+            timestamp=time(),
+            population=len(population),
+            species=len(species.species),
+            best_genome=best_genome.key,
+            best_fitness=float(fitnesses.max()),
+            mean_fitness=float(fitnesses.mean()),
+            stdev_fitness=float(fitnesses.std()),
+            min_fitness=float(fitnesses.min()),
+            evaluation_time=now - self.step_start_time
         )
-        super().__init__(config)
+        self.step_start_time = now
+
+    def post_reproduction(self, config, population, species):
+        """Time the reproduction of the generation."""
+        now = perf_counter()
+        self.row["reproduction_time"] = now - self.step_start_time
+        self.step_start_time = now
+
+    def end_generation(self, config, population, species_set):
+        """Time the speciation of the next generation and write the row of the generation."""
+        self.row["speciation_time"] = perf_counter() - self.step_start_time
+        self.emit()
+
+    def found_solution(self, config, generation, best):
+        """Write the row of the last generation, which isn't reproduced."""
+        self.emit()
+
+    def emit(self):
+        """Keep the row of the generation and queue it to be written."""
+        if self.row is None or self.row["timestamp"] is None:
+            return
+
+        self.rows.append(self.row)
+        self.writes = [write for write in self.writes if not finish(write)]
+        self.writes.append(self.writer.submit(self.write, self.row))
+        self.row = None
+
+    def write(self, row):
+        """Append a row to the file."""
+        if self.file is None:
+            # Only write the header of a CSV file that didn't exist yet
+            is_new = not os.path.exists(self.path) or not os.path.getsize(self.path)
+            self.file = open(self.path, "a", newline="")
+
+            if self.path.endswith(".csv"):
+                self.csv_writer = csv.DictWriter(self.file, self.FIELDS)
+
+                if is_new:
+                    self.csv_writer.writeheader()
+
+        if self.csv_writer is not None:
+            self.csv_writer.writerow(row)
+        else:
+            self.file.write(json.dumps(row) + "\n")
+
+        self.file.flush()
+
+    def close(self):
+        """Write the remaining rows and close the file, raising any error that occurred."""
+        self.emit()
+        self.writer.shutdown()
+
+        if self.file is not None:
+            self.file.close()
+
+        for write in self.writes:
+            write.result()
+
+
+class BatchFeedForwardNetwork(Policy):
+    @staticmethod
+    def create(genomes, config):
+        """Receive genomes and return their phenotypes as a single batch of networks."""
+        genome_config = config.genome_config
+        input_keys = genome_config.input_keys
+        output_keys = genome_config.output_keys
+        compiled = []
+
+        for genome in genomes:
+            # Gather expressed connections
+            connections = [cg.key for cg in genome.connections.values() if cg.enabled]
+            layers = feed_forward_layers(input_keys, output_keys, connections)
+
+            # Inputs and outputs come first in the values of the network, then the hidden nodes
+            slots = {key: slot for slot, key in enumerate(input_keys + output_keys)}
+            genome_layers = []
+
+            for layer in layers:
+                nodes = []
+
+                for node in sorted(layer):
+                    ng = genome.nodes[node]
+
+                    if ng.aggregation != "sum" or ng.activation != "tanh":
+                        raise ValueError("Only the sum aggregation and tanh activation are supported!")
+
+                    slots.setdefault(node, len(slots))
+                    links = [
+                        (inode, genome.connections[(inode, onode)].weight)
+                        for inode, onode in connections
+                        if onode == node
+                    ]
+                    nodes.append((node, ng.bias, ng.response, links))
+
+                genome_layers.append(nodes)
+
+            compiled.append((slots, genome_layers))
+
+        # Pad every network to the same number of values, layers and nodes per layer.
+        # The last value is a scratch slot that padded nodes write to and nothing reads from.
+        size = len(genomes)
+        num_values = max((len(slots) for slots, _ in compiled), default=0) + 1
+        num_layers = max((len(genome_layers) for _, genome_layers in compiled), default=0)
+        layers = []
+
+        for depth in range(num_layers):
+            width = max(
+                len(genome_layers[depth])
+                for _, genome_layers in compiled
+                if depth < len(genome_layers)
+            )
+            weights = np.zeros((size, width, num_values))
+            biases = np.zeros((size, width))
+            responses = np.zeros((size, width))
+            targets = np.full((size, width), num_values - 1)
+
+            for row, (slots, genome_layers) in enumerate(compiled):
+                if depth >= len(genome_layers):
+                    continue
+
+                for column, (node, bias, response, links) in enumerate(genome_layers[depth]):
+                    biases[row, column] = bias
+                    responses[row, column] = response
+                    targets[row, column] = slots[node]
+
+                    for inode, weight in links:
+                        weights[row, column, slots[inode]] = weight
+
+            layers.append((weights, biases, responses, targets))
+
+        return BatchFeedForwardNetwork(len(input_keys), len(output_keys), layers)
+
 
-        # Add reporters to show progress in the terminal
-        self.add_reporter(StdOutReporter(True))
-        self.add_reporter(StatisticsReporter())
+def export_policy(genomes, config, path):
+    """Save the networks of the genomes to a NumPy file that can be loaded without neat-python."""
+    BatchFeedForwardNetwork.create(genomes, config).save(path)
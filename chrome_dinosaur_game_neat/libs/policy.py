@@ -0,0 +1,82 @@
+import numpy as np
+
+
+class Policy:
+    # Version of the layout of the saved files, increased whenever it changes
+    FORMAT_VERSION = 1
+
+    def __init__(self, num_inputs, num_outputs, layers):
+        """Create networks that are evaluated together with NumPy alone, one row per network."""
+        self.num_inputs = num_inputs
+        self.num_outputs = num_outputs
+
+        # Each layer holds (weights, biases, responses, targets) arrays padded to the same shape
+        self.layers = layers
+
+    def __len__(self):
+        """Get the number of networks in the batch."""
+        return len(self.layers[0][1]) if self.layers else 0
+
+    def subset(self, rows):
+        """Get a batch holding only the networks at the rows (indices or a boolean mask)."""
+        layers = [tuple(array[rows] for array in layer) for layer in self.layers]
+        return type(self)(self.num_inputs, self.num_outputs, layers)
+
+    def activate(self, inputs):
+        """Evaluate each network on its row of inputs and return one row of outputs per network.
+        A single network is evaluated on every row of inputs."""
+        inputs = np.asarray(inputs, dtype=float)
+        num_values = self.layers[0][0].shape[2] if self.layers else self.num_inputs + self.num_outputs
+        values = np.zeros((len(inputs), num_values))
+        values[:, :self.num_inputs] = inputs
+        shared = len(self) == 1 and len(inputs) != 1
+
+        for weights, biases, responses, targets in self.layers:
+            # Sum the weighted inputs of every node in the layer, then apply tanh like neat-python
+            if shared:
+                sums = values @ weights[0].T
+                activations = np.tanh(np.clip(2.5 * (biases[0] + responses[0] * sums), -60, 60))
+                values[:, targets[0]] = activations
+            else:
+                sums = np.einsum("gk,gpk->gp", values, weights)
+                activations = np.tanh(np.clip(2.5 * (biases + responses * sums), -60, 60))
+                np.put_along_axis(values, targets, activations, axis=1)
+
+        return values[:, self.num_inputs:self.num_inputs + self.num_outputs]
+
+    def save(self, path):
+        """Save the networks to a compressed NumPy file."""
+        arrays = {
+            "format_version": np.array(self.FORMAT_VERSION),
+            "num_inputs": np.array(self.num_inputs),
+            "num_outputs": np.array(self.num_outputs),
+            "num_layers": np.array(len(self.layers))
+        }
+
+        for depth, (weights, biases, responses, targets) in enumerate(self.layers):
+            arrays[f"weights_{depth}"] = weights
+            arrays[f"biases_{depth}"] = biases
+            arrays[f"responses_{depth}"] = responses
+            arrays[f"targets_{depth}"] = targets.astype(np.int32)
+
+        np.savez_compressed(path, **arrays)
+
+    @classmethod
+    def load(cls, path):
+        """Load networks saved to a NumPy file."""
+        with np.load(path) as arrays:
+            version = int(arrays["format_version"])
+
+            if version != cls.FORMAT_VERSION:
+                raise ValueError(f"Unsupported policy format version: {version}")
+
+            layers = [
+                (
+                    arrays[f"weights_{depth}"],
+                    arrays[f"biases_{depth}"],
+                    arrays[f"responses_{depth}"],
+                    arrays[f"targets_{depth}"].astype(np.intp)
+                )
+                for depth in range(int(arrays["num_layers"]))
+            ]
+            return cls(int(arrays["num_inputs"]), int(arrays["num_outputs"]), layers)
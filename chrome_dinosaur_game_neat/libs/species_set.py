@@ -0,0 +1,209 @@
+from neat import DefaultSpeciesSet
+from neat.math_util import mean, stdev
+from neat.species import Species
+import numpy as np
+
+
+class GeneTable:
+    def __init__(self, genes, columns):
+        """Flatten the genes of every genome (one dict of genes per genome) into arrays that keep the order
+        of each dict, and sort their keys by genome so that the genes two genomes share are found at once."""
+        self.counts = np.array([len(genome_genes) for genome_genes in genes], dtype=np.int64)
+        self.starts = np.concatenate(([0], np.cumsum(self.counts)))
+        size = int(self.starts[-1])
+
+        # Number the keys of the genes (node IDs or pairs of them) so that a (genome, key) pair is a single integer
+        codes = np.zeros(size, dtype=np.int64)
+
+        if size:
+            keys = np.array([key for genome_genes in genes for key in genome_genes], dtype=np.int64)
+
+            for column in keys.reshape(size, -1).T:
+                codes = codes * (int(column.max() - column.min()) + 1) + (column - column.min())
+
+        unique_codes, self.ranks = np.unique(codes, return_inverse=True)
+        self.ranks = self.ranks.reshape(size)
+        self.num_codes = max(len(unique_codes), 1)
+        owners = np.repeat(np.arange(len(genes), dtype=np.int64), self.counts)
+        combined = owners * self.num_codes + self.ranks
+        self.order = np.argsort(combined, kind="stable")
+        self.sorted = combined[self.order]
+
+        # Attributes of the genes, one array per column
+        self.values = {
+            name: np.array([getattr(gene, name) for genome_genes in genes for gene in genome_genes.values()])
+            for name in columns
+        }
+
+    def distance(self, row, other_rows, gene_distance, disjoint_coefficient):
+        """Compute the node or connection term of the distances from a genome to others like
+        DefaultGenome.distance, adding up the genes in the order of the genome."""
+        count = self.counts[row]
+        other_counts = self.counts[other_rows]
+        own = np.arange(self.starts[row], self.starts[row + 1])
+
+        # Look up the keys of the genome in the other genomes
+        queries = other_rows[:, None] * self.num_codes + self.ranks[own]
+        positions = np.minimum(np.searchsorted(self.sorted, queries), len(self.sorted) - 1)
+        found = self.sorted[positions] == queries
+        other = self.order[positions]
+
+        # The homologous genes are added one after another (like a Python loop would), the others count as 0
+        total = np.zeros(len(other_rows))
+
+        if count:
+            distances = np.where(found, gene_distance(self.values, own, other), 0.0)
+            total = np.cumsum(distances, axis=1)[:, -1]
+
+        disjoint = count + other_counts - 2 * found.sum(axis=1)
+        most = np.maximum(count, other_counts)
+        return np.where(most > 0, (total + disjoint_coefficient * disjoint) / np.maximum(most, 1), 0.0)
+
+
+class GenomeDistances:
+    def __init__(self, genomes, config):
+        """Index the genes of the genomes to compute the distances between them with array operations.
+        Like neat-python's GenomeDistanceCache, the distance of a pair is only computed once."""
+        self.config = config
+        self.rows = {id(genome): row for row, genome in enumerate(genomes)}
+        self.nodes = GeneTable([genome.nodes for genome in genomes], ("bias", "response", "activation", "aggregation"))
+        self.connections = GeneTable([genome.connections for genome in genomes], ("weight", "enabled"))
+
+        # Key of a genome -> {key of another genome: distance}, with each pair only stored the way it was computed
+        self.distances = {}
+
+    def get(self, genome, others):
+        """Get the distances from the genome to the others, only computing those that aren't known yet."""
+        key = genome.key
+        known = self.distances.setdefault(key, {})
+        distances = [
+            known[other.key] if other.key in known else self.distances.get(other.key, {}).get(key)
+            for other in others
+        ]
+        missing = [i for i, distance in enumerate(distances) if distance is None]
+
+        if missing:
+            other_rows = np.array([self.rows[id(others[i])] for i in missing], dtype=np.int64)
+            computed = self.compute(self.rows[id(genome)], other_rows).tolist()
+            known.update(zip((others[i].key for i in missing), computed))
+
+            for i, distance in zip(missing, computed):
+                distances[i] = distance
+
+        return distances
+
+    def lookup(self, key, other_key):
+        """Get the known distance between the genomes of the keys."""
+        distance = self.distances[key].get(other_key)
+        return self.distances[other_key][key] if distance is None else distance
+
+    def compute(self, row, other_rows):
+        """Compute the distances from the genome at the row to those at the other rows."""
+        config = self.config
+        weight_coefficient = config.compatibility_weight_coefficient
+
+        def node_distance(values, own, other):
+            bias = values["bias"]
+            response = values["response"]
+            distance = np.abs(bias[own] - bias[other]) + np.abs(response[own] - response[other])
+            distance += values["activation"][own] != values["activation"][other]
+            distance += values["aggregation"][own] != values["aggregation"][other]
+            return distance * weight_coefficient
+
+        def connection_distance(values, own, other):
+            weight = values["weight"]
+            distance = np.abs(weight[own] - weight[other])
+            distance += values["enabled"][own] != values["enabled"][other]
+            return distance * weight_coefficient
+
+        disjoint_coefficient = config.compatibility_disjoint_coefficient
+        return (
+            self.nodes.distance(row, other_rows, node_distance, disjoint_coefficient)
+            + self.connections.distance(row, other_rows, connection_distance, disjoint_coefficient)
+        )
+
+    def get_all(self):
+        """Get every known distance, once per direction like neat-python's cache."""
+        return [
+            distance
+            for key, known in self.distances.items()
+            for other_key, distance in known.items()
+            for _ in range(1 if key == other_key else 2)
+        ]
+
+
+class SpeciesSet(DefaultSpeciesSet):
+    def speciate(self, config, population, generation):
+        """Place the genomes into species by genetic similarity. The species are the same as those of
+        DefaultSpeciesSet, but the distances are computed in batches and only once per pair."""
+        compatibility_threshold = self.species_set_config.compatibility_threshold
+
+        # The representatives of the previous generation may not be part of the population anymore
+        genomes = list(population.values()) + [
+            species.representative
+            for species in self.species.values()
+            if population.get(species.representative.key) is not species.representative
+        ]
+        distances = GenomeDistances(genomes, config.genome_config)
+
+        # Find the best representatives for each existing species
+        unspeciated = set(population.keys())
+        new_representatives = {}
+        new_members = {}
+
+        for sid, species in self.species.items():
+            # The new representative is the genome closest to the current representative
+            gids = list(unspeciated)
+            rdists = distances.get(species.representative, [population[gid] for gid in gids])
+            new_rid = gids[int(np.argmin(rdists))]
+            new_representatives[sid] = new_rid
+            new_members[sid] = [new_rid]
+            unspeciated.remove(new_rid)
+
+        # Compare each representative to all the genomes left at once, before the genomes are placed
+        for rid in new_representatives.values():
+            distances.get(population[rid], [population[gid] for gid in unspeciated])
+
+        # Partition the population into species based on genetic similarity
+        while unspeciated:
+            gid = unspeciated.pop()
+
+            # Find the species with the most similar representative
+            candidates = []
+
+            for sid, rid in new_representatives.items():
+                sdist = distances.lookup(rid, gid)
+
+                if sdist < compatibility_threshold:
+                    candidates.append((sdist, sid))
+
+            if candidates:
+                _, sid = min(candidates, key=lambda candidate: candidate[0])
+                new_members[sid].append(gid)
+            else:
+                # No species is similar enough, so the genome represents a new species
+                sid = next(self.indexer)
+                new_representatives[sid] = gid
+                new_members[sid] = [gid]
+                distances.get(population[gid], [population[other_gid] for other_gid in unspeciated])
+
+        # Update the species
+        self.genome_to_species = {}
+
+        for sid, rid in new_representatives.items():
+            species = self.species.get(sid)
+
+            if species is None:
+                species = self.species[sid] = Species(sid, generation)
+
+            members = new_members[sid]
+
+            for gid in members:
+                self.genome_to_species[gid] = sid
+
+            species.update(population[rid], {gid: population[gid] for gid in members})
+
+        all_distances = distances.get_all()
+        gdmean = mean(all_distances)
+        gdstdev = stdev(all_distances)
+        self.reporters.info(f"Mean genetic distance {gdmean:.3f}, standard deviation {gdstdev:.3f}")
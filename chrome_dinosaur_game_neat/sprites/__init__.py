@@ -1,7 +1,7 @@
 from .bird import Bird
 from .cactus import Cactus
 from .cloud import Cloud
-from .dinosaur import Dinosaur, DinosaurAI
+from .dinosaur import Dinosaur
 from .moon import Moon
 from .star import Star
 from .terrain import Terrain
@@ -1,10 +1,10 @@
 from pyglet.image import ImageGrid, Animation
 from .sprite import BaseSprite
-from ..utils import get_sprite_map
+from ..utils import LazyAsset, get_sprite_map
 
 
 class Bird(BaseSprite):
-    IMAGES = [
+    IMAGES = LazyAsset(lambda: [
         Animation.from_image_sequence(
             ImageGrid(
                 image=get_sprite_map().get_region(260, 48, 184, 80),
@@ -16,9 +16,4 @@ class Bird(BaseSprite):
             duration=0.3,
             loop=True
         )
-    ]
-
-    def __init__(self, *args, **kwargs):
-        """Create a bird."""
-        image = self.IMAGES[0]
-        super().__init__(image, *args, **kwargs)
+    ])
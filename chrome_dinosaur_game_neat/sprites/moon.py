@@ -1,31 +1,36 @@
 from .sprite import BaseSprite
-from ..utils import get_sprite_map
-from itertools import cycle
+from ..utils import LazyAsset, get_sprite_map
 
 
 class Moon(BaseSprite):
+    IMAGES = LazyAsset(lambda: [
+        get_sprite_map().get_region(1234, 47, 40, 82),
+        get_sprite_map().get_region(1194, 47, 40, 82),
+        get_sprite_map().get_region(1154, 47, 40, 82),
+        get_sprite_map().get_region(1074, 47, 80, 82),
+        get_sprite_map().get_region(1034, 47, 40, 82),
+        get_sprite_map().get_region(994, 47, 40, 82),
+        get_sprite_map().get_region(954, 47, 40, 82)
+    ])
+
     def __init__(self, *args, **kwargs):
         """Create a moon."""
-        self.phases = cycle((
-            get_sprite_map().get_region(1234, 47, 40, 82),
-            get_sprite_map().get_region(1194, 47, 40, 82),
-            get_sprite_map().get_region(1154, 47, 40, 82),
-            get_sprite_map().get_region(1074, 47, 80, 82),
-            get_sprite_map().get_region(1034, 47, 40, 82),
-            get_sprite_map().get_region(994, 47, 40, 82),
-            get_sprite_map().get_region(954, 47, 40, 82)
-        ))
-        image = next(self.phases)
-        super().__init__(image, *args, **kwargs)
+        super().__init__(*args, **kwargs)
+        self.phase = self.entity.phase
+
+    def get_image(self):
+        """Get the image of the current phase of the moon."""
+        return self.IMAGES[self.entity.phase]
 
-    def set_next_phase(self):
-        """Set the next phase of the moon's cycle."""
-        self.x += 3000
-        self.image = next(self.phases)
+    def bind(self, entity):
+        """Reuse the sprite to draw another moon."""
+        super().bind(entity)
+        self.phase = self.entity.phase
 
-    def update(self, dt):
-        """Update the moon."""
-        if self.x + 80 < 0:
-            self.set_next_phase()
+    def sync(self):
+        """Move the moon and show its current phase."""
+        if self.phase != self.entity.phase:
+            self.phase = self.entity.phase
+            self.image = self.get_image()
 
-        super().update(dt)
+        super().sync()
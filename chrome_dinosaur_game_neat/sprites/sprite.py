@@ -2,24 +2,40 @@ from pyglet.sprite import Sprite
 
 
 class BaseSprite(Sprite):
-    def __init__(self, image, x, y, velx=0, vely=0, *args, **kwargs):
-        """Create a base sprite."""
+    # Released sprites are hidden and reused, keeping their vertices in the batch
+    POOLED = True
+
+    def __init__(self, entity, *args, **kwargs):
+        """Create a sprite that draws an entity of the game world."""
+        self.entity = entity
+
         # Inherit the sprite class
-        super().__init__(image, x, y, *args, **kwargs)
+        super().__init__(self.get_image(), entity.x, entity.y, *args, **kwargs)
+
+        # Sprites that are no longer needed are kept here to draw other entities
+        self.pool = None
 
-        # Save the velocity of the sprite relative to the screen
-        self.velx = velx
-        self.vely = vely
+    def get_image(self):
+        """Get the image that shows the current state of the entity."""
+        return self.IMAGES[0]
 
-    def update(self, dt):
-        """Update the sprite."""
-        self.x += self.velx * dt
-        self.y += self.vely * dt
+    def sync(self):
+        """Move the sprite to the position of the entity."""
+        self.position = (self.entity.x, self.entity.y)
 
-    def __del__(self):
-        """Delete the sprite."""
-        try:
-            # Attempt to delete the sprite from video memory if available
+    def bind(self, entity):
+        """Reuse the sprite to draw another entity."""
+        self.entity = entity
+        self.image = self.get_image()
+        self.position = (entity.x, entity.y)
+        self.visible = True
+
+    def release(self):
+        """Hide the sprite and put it back in its pool, or delete it if it has none."""
+        if self.pool is None:
             self.delete()
-        except:
-            pass
+            return
+
+        self.visible = False
+        self.entity = None
+        self.pool.append(self)
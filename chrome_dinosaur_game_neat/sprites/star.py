@@ -1,21 +1,21 @@
 from .sprite import BaseSprite
-from ..utils import get_sprite_map
-import random
+from ..utils import LazyAsset, get_sprite_map
 
 
 class Star(BaseSprite):
-    IMAGES = (
+    IMAGES = LazyAsset(lambda: (
         get_sprite_map().get_region(1274, 74, 18, 18),
         get_sprite_map().get_region(1274, 92, 18, 18),
         get_sprite_map().get_region(1274, 110, 18, 18)
-    )
+    ))
 
-    def __init__(self, *args, **kwargs):
-        """Create a star."""
-        image = random.choice(self.IMAGES)
-        super().__init__(image, *args, **kwargs)
+    def get_image(self):
+        """Get the image of the star."""
+        return self.IMAGES[self.entity.image_index]
 
-    def update(self, dt, opacity):
-        """Update the star."""
-        self.opacity = opacity
-        super().update(dt)
+    def sync(self):
+        """Move the star and fade it in or out."""
+        if self.opacity != self.entity.opacity:
+            self.opacity = self.entity.opacity
+
+        super().sync()
@@ -0,0 +1,111 @@
+from time import perf_counter, time
+import json
+
+
+class SpeedMeter:
+    def __init__(self):
+        """Create a meter that measures how many seconds are simulated per wall-clock second."""
+        self.simulated_time = 0
+        self.start_time = perf_counter()
+
+    def add(self, dt):
+        """Add simulated time to the measure."""
+        self.simulated_time += dt
+
+    def read(self):
+        """Get the speed since the last reading and start measuring again."""
+        now = perf_counter()
+        speed = self.simulated_time / (now - self.start_time)
+        self.simulated_time = 0
+        self.start_time = now
+        return speed
+
+
+class Profiler:
+    def __init__(self, dump_file=None, dump_interval=10):
+        """Create a profiler that measures the time spent in each phase of the game."""
+        # Calls, total time and longest time of each phase since the start
+        self.calls = {}
+        self.totals = {}
+        self.maxima = {}
+
+        # Time spent in each phase by the current generation, and by the generations that ended
+        self.generation_totals = {}
+        self.generations = []
+
+        # Periodically append the statistics to a JSON lines file if given
+        self.dump_file = dump_file
+        self.dump_interval = dump_interval
+        self.last_dump = perf_counter()
+        self.dumped_generations = 0
+
+    def add(self, phase, elapsed):
+        """Add the time spent in one call of a phase."""
+        if phase in self.calls:
+            self.calls[phase] += 1
+            self.totals[phase] += elapsed
+            self.generation_totals[phase] = self.generation_totals.get(phase, 0) + elapsed
+
+            if elapsed > self.maxima[phase]:
+                self.maxima[phase] = elapsed
+        else:
+            self.calls[phase] = 1
+            self.totals[phase] = elapsed
+            self.maxima[phase] = elapsed
+            self.generation_totals[phase] = elapsed
+
+    def time(self, phase, function):
+        """Wrap the function of a phase so that every call of it is timed."""
+        def timed(*args):
+            start = perf_counter()
+            function(*args)
+            self.add(phase, perf_counter() - start)
+
+        return timed
+
+    def get_stats(self):
+        """Get the number of calls and the total, mean and longest time (in seconds) of each phase."""
+        return {
+            phase: {
+                "calls": calls,
+                "total": self.totals[phase],
+                "mean": self.totals[phase] / calls,
+                "max": self.maxima[phase]
+            }
+            for phase, calls in self.calls.items()
+        }
+
+    def end_generation(self, generation):
+        """Record the time spent in each phase by the generation that ended."""
+        self.generations.append({"generation": generation, "phases": self.generation_totals})
+        self.generation_totals = {}
+        self.dump()
+
+    def dump(self, force=False):
+        """Append the statistics to the dump file if the dump interval elapsed (or if forced)."""
+        now = perf_counter()
+
+        if self.dump_file is None or (not force and now - self.last_dump < self.dump_interval):
+            return
+
+        # Only the generations that ended since the last dump are written
+        record = {
+            "time": time(),
+            "phases": self.get_stats(),
+            "generations": self.generations[self.dumped_generations:]
+        }
+
+        with open(self.dump_file, "a") as file:
+            file.write(json.dumps(record) + "\n")
+
+        self.last_dump = now
+        self.dumped_generations = len(self.generations)
+
+    def reset(self):
+        """Forget every measure."""
+        self.calls.clear()
+        self.totals.clear()
+        self.maxima.clear()
+        self.generation_totals = {}
+        self.generations.clear()
+        self.dumped_generations = 0
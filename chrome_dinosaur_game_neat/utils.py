@@ -1,9 +1,30 @@
-from pyglet.image import load
 from functools import cache
-import os
+from .constants import FONT_FILE_NAME, FONT_NAME, SPRITE_MAP_FILE_NAME
+import pyglet
+
+
+class LazyAsset:
+    def __init__(self, load):
+        """Create a class attribute that is only loaded the first time it is used."""
+        self.load = load
+
+    def __set_name__(self, owner, name):
+        self.name = name
+
+    def __get__(self, instance, owner):
+        # Replace the attribute with the loaded asset so it is only loaded once
+        asset = self.load()
+        setattr(owner, self.name, asset)
+        return asset
 
 
 @cache
 def get_sprite_map():
-    path = "chrome_dinosaur_game_neat/assets/images/sprites.png"
-    return load(os.path.abspath(path))
+    return pyglet.image.load(SPRITE_MAP_FILE_NAME)
+
+
+@cache
+def load_font():
+    """Load the font used by the HUD."""
+    pyglet.font.add_file(FONT_FILE_NAME)
+    pyglet.font.load(FONT_NAME)
@@ -0,0 +1,11 @@
+from .bird import Bird
+from .cactus import Cactus
+from .cloud import Cloud
+from .course import Course, get_course
+from .dinosaur import Dinosaur, DinosaurAI
+from .entity import Entity
+from .herd import Herd
+from .moon import Moon
+from .obstacle_queue import ObstacleQueue
+from .star import Star
+from .terrain import Terrain
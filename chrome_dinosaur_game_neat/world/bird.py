@@ -0,0 +1,5 @@
+from .entity import Entity
+
+
+class Bird(Entity):
+    SIZE = (92, 80)
@@ -0,0 +1,19 @@
+from .entity import Entity
+import random
+
+
+class Cactus(Entity):
+    SIZES = [
+        (34, 70),   # Small cacti 1
+        (68, 70),   # Small cacti 2
+        (102, 70),  # Small cacti 3
+        (50, 98),   # Large cacti 1
+        (100, 98),  # Large cacti 2
+        (150, 98),  # Large cacti 3
+    ]
+
+    def __init__(self, *args, image_index=None, **kwargs):
+        """Create a cactus. If no image is specified, a random one is chosen."""
+        super().__init__(*args, **kwargs)
+        self.image_index = random.randrange(len(self.SIZES)) if image_index is None else image_index
+        self.width, self.height = self.SIZES[self.image_index]
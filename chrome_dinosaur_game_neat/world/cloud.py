@@ -0,0 +1,5 @@
+from .entity import Entity
+
+
+class Cloud(Entity):
+    SIZE = (95, 28)
@@ -0,0 +1,106 @@
+from ..constants import OBSTACLE_VELOCITY, VELOCITY_INCREMENT, VELOCITY_INTERVAL
+from functools import lru_cache
+from math import floor
+from random import Random
+import numpy as np
+
+
+class Course:
+    # Kinds of obstacles
+    CACTUS = 0
+    BIRD = 1
+
+    # Compact records of the spawns, sorted by time (in seconds since the start of the course)
+    OBSTACLE_DTYPE = np.dtype([("time", "f8"), ("kind", "u1"), ("image", "u1"), ("y", "i2"), ("velx", "f8")])
+    CLOUD_DTYPE = np.dtype([("time", "f8"), ("y", "i2")])
+    STAR_DTYPE = np.dtype([("time", "f8"), ("y", "i2"), ("image", "u1")])
+
+    # Number of seconds of the course generated at a time
+    CHUNK_DURATION = 300
+
+    def __init__(self, seed):
+        """Create the course of obstacles, clouds and stars generated from the seed."""
+        self.seed = seed
+
+        # Each kind of spawn has its own generator so they can be extended independently
+        self.obstacle_random = Random(f"{seed}:obstacles")
+        self.cloud_random = Random(f"{seed}:clouds")
+        self.star_random = Random(f"{seed}:stars")
+
+        self.obstacles = np.empty(0, dtype=self.OBSTACLE_DTYPE)
+        self.clouds = np.empty(0, dtype=self.CLOUD_DTYPE)
+        self.stars = np.empty(0, dtype=self.STAR_DTYPE)
+
+        # Time of the next spawn of each kind
+        self.next_obstacle_time = self.obstacle_random.uniform(1, 3)
+        self.next_cloud_time = self.cloud_random.uniform(1, 4)
+        self.next_star_time = 0  # Spawn a star immediately
+
+        self.duration = 0
+        self.extend()
+
+    @staticmethod
+    def get_velocity(time):
+        """Get the horizontal velocity of the obstacles at the time."""
+        return OBSTACLE_VELOCITY + VELOCITY_INCREMENT * floor(time / VELOCITY_INTERVAL)
+
+    def extend(self):
+        """Generate the next chunk of the course."""
+        self.duration += self.CHUNK_DURATION
+        obstacles = []
+        clouds = []
+        stars = []
+
+        while self.next_obstacle_time < self.duration:
+            time = self.next_obstacle_time
+            velx = self.get_velocity(time)
+
+            if self.obstacle_random.randint(1, 6) == 6:
+                y = self.obstacle_random.choice((50, 125, 200))
+                obstacles.append((time, self.BIRD, 0, y, velx - 100))
+            else:
+                image = self.obstacle_random.randrange(6)
+                obstacles.append((time, self.CACTUS, image, 45, velx))
+
+            self.next_obstacle_time += self.obstacle_random.uniform(1, 2.5)
+
+        while self.next_cloud_time < self.duration:
+            clouds.append((self.next_cloud_time, self.cloud_random.randint(225, 325)))
+            self.next_cloud_time += self.cloud_random.uniform(2, 5)
+
+        while self.next_star_time < self.duration:
+            y = self.star_random.randint(200, 350)
+            image = self.star_random.randrange(3)
+            stars.append((self.next_star_time, y, image))
+            self.next_star_time += self.star_random.uniform(30, 50)
+
+        self.obstacles = np.concatenate((self.obstacles, np.array(obstacles, dtype=self.OBSTACLE_DTYPE)))
+        self.clouds = np.concatenate((self.clouds, np.array(clouds, dtype=self.CLOUD_DTYPE)))
+        self.stars = np.concatenate((self.stars, np.array(stars, dtype=self.STAR_DTYPE)))
+
+    def get_obstacle(self, index):
+        """Get the (time, kind, image, y, velx) of an obstacle, generating more of the course if needed."""
+        while index >= len(self.obstacles):
+            self.extend()
+
+        return self.obstacles[index].item()
+
+    def get_cloud(self, index):
+        """Get the (time, y) of a cloud, generating more of the course if needed."""
+        while index >= len(self.clouds):
+            self.extend()
+
+        return self.clouds[index].item()
+
+    def get_star(self, index):
+        """Get the (time, y, image) of a star, generating more of the course if needed."""
+        while index >= len(self.stars):
+            self.extend()
+
+        return self.stars[index].item()
+
+
+@lru_cache(maxsize=64)
+def get_course(seed):
+    """Get the course of the seed, reusing it if it was already generated by this process."""
+    return Course(seed)
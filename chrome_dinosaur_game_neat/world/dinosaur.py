@@ -0,0 +1,129 @@
+from neat.nn import FeedForwardNetwork
+from .entity import Entity
+
+
+class Dinosaur(Entity):
+    RUN_SIZE = (88, 96)
+    DUCK_SIZE = (118, 62)
+    JUMP_SIZE = (88, 95)
+    COLLISION_SIZE = (88, 95)
+    SIZE = RUN_SIZE
+    MAX_WIDTH = max(RUN_SIZE[0], DUCK_SIZE[0], JUMP_SIZE[0], COLLISION_SIZE[0])
+    JUMP_VELOCITY = 1200  # Units per second
+    GRAVITY = 4500  # Units per second squared
+
+    def __init__(self, *args, **kwargs):
+        """Create a dinosaur."""
+        super().__init__(*args, **kwargs)
+
+        # Jumping and ducking variables keep track of the dinosaur's actions
+        self.jumping = False
+        self.ducking = False
+        self.crashed = False
+
+    def jump(self):
+        """Make the dinosaur jump."""
+        self.vely = self.JUMP_VELOCITY
+        self.width, self.height = self.JUMP_SIZE
+        self.jumping = True
+
+    def land(self):
+        """Stop the dinosaur from falling."""
+        self.y = 45
+        self.vely = 0
+        self.width, self.height = self.RUN_SIZE
+        self.jumping = False
+
+    def duck(self):
+        """Make the dinosaur duck."""
+        self.width, self.height = self.DUCK_SIZE
+        self.ducking = True
+
+    def rise(self):
+        """Make the dinosaur stand up straight."""
+        self.width, self.height = self.RUN_SIZE
+        self.ducking = False
+
+    def collided(self):
+        """Update the dinosaur if it collided with an object."""
+        self.width, self.height = self.COLLISION_SIZE
+        self.crashed = True
+
+    def reset(self, y):
+        """Reset the dinosaur."""
+        self.y = y
+        self.vely = 0
+        self.width, self.height = self.RUN_SIZE
+        self.jumping = False
+        self.ducking = False
+        self.crashed = False
+
+    def has_collided(self, obstacle):
+        """Check if the dinosaur runs into the obstacle."""
+        # If one entity is on left side of other, then no collision is possible
+        if self.x + self.width <= obstacle.x or obstacle.x + obstacle.width <= self.x:
+            return False
+
+        # If one entity is above other, then no collision is possible
+        if self.y + self.height <= obstacle.y or obstacle.y + obstacle.height <= self.y:
+            return False
+
+        # The only other outcome is that they overlap
+        return True
+
+    def update(self, dt, controller):
+        """Update the dinosaur. If an output is provided, use it to control the dinosaur."""
+        if controller:
+            # Determine if the dinosaur should duck or jump
+            if controller[0] > 0.5 and not self.jumping and not self.ducking:
+                # Start ducking animation
+                self.duck()
+            elif controller[0] <= 0.5 and not self.jumping and self.ducking:
+                # End duck animation
+                self.rise()
+            elif controller[1] > 0.5 and not self.jumping and not self.ducking:
+                # Start jumping animation
+                self.jump()
+
+        if self.jumping:
+            # Follow the exact trajectory under gravity so that the jump doesn't depend on dt
+            self.y += self.vely * dt - 0.5 * self.GRAVITY * dt ** 2
+            self.vely -= self.GRAVITY * dt
+
+            # Check if it has landed
+            if self.y <= 45 and self.vely <= 0:
+                self.land()
+
+        self.x += self.velx * dt
+
+
+class DinosaurAI(Dinosaur):
+    def __init__(self, *args, **kwargs):
+        """Create a dinosaur that is controlled by AI."""
+        genome = kwargs.pop('genome', None)
+        config = kwargs.pop('config', None)
+
+        if genome is None:
+            raise ValueError('A genome must be provided!')
+        elif config is None:
+            raise ValueError('A config must be provided!')
+
+        super().__init__(*args, **kwargs)
+        genome.fitness = 0  # Start with fitness value at 0
+        self.neural_net = FeedForwardNetwork.create(genome, config)
+        self.genome = genome
+
+    def think(self, obstacle):
+        """Let the AI make a decision by itself."""
+        return self.neural_net.activate((
+            self.y,
+            obstacle.y,
+            obstacle.width,
+            obstacle.height,
+            abs(self.x + self.width - obstacle.x),  # Distance
+            obstacle.velx
+        )) if obstacle else None
+
+    def reward(self, dt):
+        """Reward the dinosaur for surviving."""
+        self.genome.fitness += dt
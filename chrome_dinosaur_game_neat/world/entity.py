@@ -0,0 +1,26 @@
+class Entity:
+    SIZE = (0, 0)
+
+    def __init__(self, x, y, velx=0, vely=0):
+        """Create an entity of the game world."""
+        self.x = x
+        self.y = y
+        self.width, self.height = self.SIZE
+
+        # Save the velocity of the entity relative to the screen
+        self.velx = velx
+        self.vely = vely
+
+        # Sprite drawing the entity, if the world is rendered
+        self.sprite = None
+
+    def update(self, dt):
+        """Update the entity."""
+        self.x += self.velx * dt
+        self.y += self.vely * dt
+
+    def delete(self):
+        """Release the sprite drawing the entity, if any."""
+        if self.sprite is not None:
+            self.sprite.release()
+            self.sprite = None
@@ -0,0 +1,231 @@
+from .dinosaur import Dinosaur
+from ..libs.neat import BatchFeedForwardNetwork
+import numpy as np
+
+
+class Herd:
+    def __init__(self, x, y, genomes=None, config=None, size=None, networks=None):
+        """Create a herd of dinosaurs whose states are stored in arrays. The dinosaurs think with
+        the neural networks of the genomes or the given networks (a Policy), otherwise a size must be given."""
+        if genomes is not None:
+            size = len(genomes)
+        elif networks is not None:
+            size = len(networks)
+        elif size is None:
+            raise ValueError('Genomes, networks or a size must be provided!')
+
+        # Every dinosaur runs at the same horizontal position
+        self.x = x
+        self.ground = y
+
+        # Boxes and actions of the dinosaurs
+        self.y = np.full(size, y, dtype=float)
+        self.vely = np.zeros(size)
+        self.width = np.full(size, Dinosaur.RUN_SIZE[0], dtype=float)
+        self.height = np.full(size, Dinosaur.RUN_SIZE[1], dtype=float)
+        self.jumping = np.zeros(size, dtype=bool)
+        self.ducking = np.zeros(size, dtype=bool)
+
+        # Keep track of which dinosaurs are still in the game
+        self.alive = np.ones(size, dtype=bool)
+        self.alive_indices = np.arange(size)
+
+        # Start with fitness values at 0
+        self.genomes = genomes
+        self.fitness = np.zeros(size)
+
+        # Compile the networks of the whole generation so they can think together.
+        # The rows of the networks (and of their last decisions) always match the alive dinosaurs.
+        self.neural_nets = networks
+        self.decisions = None
+
+        if genomes is not None:
+            self.neural_nets = BatchFeedForwardNetwork.create(genomes, config)
+
+            for genome in genomes:
+                genome.fitness = 0
+
+        # Entities mirroring the alive dinosaurs, only created if the herd is drawn
+        self.dinosaurs = {}
+
+    def __len__(self):
+        """Get the number of dinosaurs that are still alive."""
+        return len(self.alive_indices)
+
+    def collide(self, obstacles):
+        """Remove the dinosaurs that run into any of the obstacles."""
+        if not obstacles or not len(self):
+            return
+
+        indices = self.alive_indices
+        x = self.x
+        y = self.y[indices]
+        width = self.width[indices]
+        height = self.height[indices]
+
+        # Test every obstacle against every dinosaur at once (obstacles x dinosaurs)
+        obstacle_x = np.array([obstacle.x for obstacle in obstacles])[:, None]
+        obstacle_y = np.array([obstacle.y for obstacle in obstacles])[:, None]
+        obstacle_width = np.array([obstacle.width for obstacle in obstacles])[:, None]
+        obstacle_height = np.array([obstacle.height for obstacle in obstacles])[:, None]
+        overlaps = (
+            (x + width > obstacle_x)
+            & (obstacle_x + obstacle_width > x)
+            & (y + height > obstacle_y)
+            & (obstacle_y + obstacle_height > y)
+        )
+        collided = overlaps.any(axis=0)
+
+        if collided.any():
+            self.kill(indices[collided])
+
+    def kill(self, indices):
+        """Remove the dinosaurs at the indices from the game."""
+        self.alive[indices] = False
+
+        if self.neural_nets is not None:
+            self.neural_nets = self.neural_nets.subset(self.alive[self.alive_indices])
+
+        if self.decisions is not None:
+            self.decisions = self.decisions[self.alive[self.alive_indices]]
+
+        self.alive_indices = np.flatnonzero(self.alive)
+
+        for index in indices.tolist():
+            if self.genomes is not None:
+                self.genomes[index].fitness = float(self.fitness[index])
+
+            # Delete the entity drawing the dinosaur, if any
+            dinosaur = self.dinosaurs.pop(index, None)
+
+            if dinosaur is not None:
+                dinosaur.delete()
+
+    def clear(self):
+        """Remove every dinosaur that is still alive."""
+        self.kill(self.alive_indices)
+
+    def reward(self, dt):
+        """Reward the dinosaurs for surviving."""
+        self.fitness[self.alive_indices] += dt
+
+    def observe(self, obstacle):
+        """Get the inputs of the neural networks of the alive dinosaurs."""
+        indices = self.alive_indices
+        observations = np.empty((len(indices), 6))
+        observations[:, 0] = self.y[indices]
+        observations[:, 1] = obstacle.y
+        observations[:, 2] = obstacle.width
+        observations[:, 3] = obstacle.height
+        observations[:, 4] = np.abs(self.x + self.width[indices] - obstacle.x)  # Distance
+        observations[:, 5] = obstacle.velx
+        return observations
+
+    def think(self, obstacle):
+        """Let the AI of every alive dinosaur make a decision at once."""
+        if obstacle is None or not len(self):
+            return None
+
+        return self.neural_nets.activate(self.observe(obstacle))
+
+    def decide(self, obstacle):
+        """Let the AI of every alive dinosaur make a decision and remember it until the next one."""
+        self.decisions = self.think(obstacle)
+        return self.decisions
+
+    def coast(self, dt, steps):
+        """Let the alive dinosaurs run for a number of steps without any decision, rewarding them for every step.
+        The steps are worked out at once, so the dinosaurs only differ from updating them step by step by rounding."""
+        indices = self.alive_indices
+        duration = steps * dt
+        self.fitness[indices] += duration
+
+        # The dinosaurs in the air follow their trajectories under gravity and land at the end of the first step
+        # where they are back on the ground, at the time the trajectory meets the ground on the way down
+        jumping = indices[self.jumping[indices]]
+        y = self.y[jumping]
+        vely = self.vely[jumping]
+        landing_time = (vely + np.sqrt(np.maximum(vely ** 2 + 2 * Dinosaur.GRAVITY * (y - self.ground), 0))) / Dinosaur.GRAVITY
+        landed = np.ceil(landing_time / dt - 1e-9) <= steps
+
+        self.y[jumping] = np.where(landed, self.ground, y + vely * duration - 0.5 * Dinosaur.GRAVITY * duration ** 2)
+        self.vely[jumping] = np.where(landed, 0, vely - Dinosaur.GRAVITY * duration)
+        landed = jumping[landed]
+        self.width[landed], self.height[landed] = Dinosaur.RUN_SIZE
+        self.jumping[landed] = False
+
+    def fall(self, dt, y, vely, jumping):
+        """Move the jumping dinosaurs along their trajectories under gravity and get those that landed."""
+        # Follow the exact trajectories under gravity so that the jumps don't depend on dt
+        y[jumping] += vely[jumping] * dt - 0.5 * Dinosaur.GRAVITY * dt ** 2
+        vely[jumping] -= Dinosaur.GRAVITY * dt
+
+        # Land the dinosaurs that fell back to the ground
+        landed = jumping & (y <= self.ground) & (vely <= 0)
+        y[landed] = self.ground
+        vely[landed] = 0
+        return landed
+
+    def update(self, dt, controllers):
+        """Update the alive dinosaurs. If outputs are provided, use them to control the dinosaurs."""
+        indices = self.alive_indices
+        y = self.y[indices]
+        vely = self.vely[indices]
+        width = self.width[indices]
+        height = self.height[indices]
+        jumping = self.jumping[indices]
+        ducking = self.ducking[indices]
+
+        if controllers is not None:
+            # Determine if the dinosaurs should duck or jump
+            wants_duck = controllers[:, 0] > 0.5
+            wants_jump = controllers[:, 1] > 0.5
+            duck = ~jumping & ~ducking & wants_duck
+            rise = ~jumping & ducking & ~wants_duck
+            jump = ~jumping & ~ducking & ~wants_duck & wants_jump
+
+            width[duck], height[duck] = Dinosaur.DUCK_SIZE
+            ducking[duck] = True
+            width[rise], height[rise] = Dinosaur.RUN_SIZE
+            ducking[rise] = False
+            vely[jump] = Dinosaur.JUMP_VELOCITY
+            width[jump], height[jump] = Dinosaur.JUMP_SIZE
+            jumping[jump] = True
+
+        landed = self.fall(dt, y, vely, jumping)
+        width[landed], height[landed] = Dinosaur.RUN_SIZE
+        jumping &= ~landed
+
+        self.y[indices] = y
+        self.vely[indices] = vely
+        self.width[indices] = width
+        self.height[indices] = height
+        self.jumping[indices] = jumping
+        self.ducking[indices] = ducking
+
+    def get_dinosaurs(self, limit=None):
+        """Get entities mirroring the fittest alive dinosaurs (all of them if there is no limit) to draw them."""
+        indices = self.alive_indices
+
+        if limit is not None and len(indices) > limit:
+            # Ties are broken by index so that the same dinosaurs stay drawn
+            order = np.argsort(-self.fitness[indices], kind="stable")
+            indices = indices[order[:limit]]
+
+            # Stop drawing the dinosaurs that were culled
+            for index in self.dinosaurs.keys() - set(indices.tolist()):
+                self.dinosaurs.pop(index).delete()
+
+        for index in indices.tolist():
+            dinosaur = self.dinosaurs.get(index)
+
+            if dinosaur is None:
+                dinosaur = self.dinosaurs[index] = Dinosaur(self.x, self.ground)
+
+            dinosaur.y = self.y[index]
+            dinosaur.width = self.width[index]
+            dinosaur.height = self.height[index]
+            dinosaur.jumping = self.jumping[index]
+            dinosaur.ducking = self.ducking[index]
+
+        return self.dinosaurs.values()
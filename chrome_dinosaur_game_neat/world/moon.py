@@ -0,0 +1,24 @@
+from .entity import Entity
+
+
+class Moon(Entity):
+    SIZES = [(40, 82), (40, 82), (40, 82), (80, 82), (40, 82), (40, 82), (40, 82)]
+
+    def __init__(self, *args, **kwargs):
+        """Create a moon."""
+        super().__init__(*args, **kwargs)
+        self.phase = 0
+        self.width, self.height = self.SIZES[self.phase]
+
+    def set_next_phase(self):
+        """Set the next phase of the moon's cycle."""
+        self.x += 3000
+        self.phase = (self.phase + 1) % len(self.SIZES)
+        self.width, self.height = self.SIZES[self.phase]
+
+    def update(self, dt):
+        """Update the moon."""
+        if self.x + 80 < 0:
+            self.set_next_phase()
+
+        super().update(dt)
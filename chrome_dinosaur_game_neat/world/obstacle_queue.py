@@ -0,0 +1,71 @@
+from collections import deque
+
+
+class ObstacleQueue:
+    def __init__(self, x):
+        """Create a queue of obstacles ordered by x that keeps track of the next one ahead of a position.
+        Obstacles spawn at the right of the screen and move at nearly the same velocity, so they never
+        overtake each other before leaving the screen and the order of the spawns is the order by x."""
+        self.x = x
+        self.obstacles = deque()
+
+        # Number of obstacles at the front of the queue that already passed the position
+        self.passed = 0
+
+    def __len__(self):
+        """Get the number of obstacles."""
+        return len(self.obstacles)
+
+    def __iter__(self):
+        """Iterate over the obstacles from left to right."""
+        return iter(self.obstacles)
+
+    def append(self, obstacle):
+        """Add an obstacle to the right of the others."""
+        self.obstacles.append(obstacle)
+
+    def clear(self):
+        """Remove every obstacle."""
+        self.obstacles.clear()
+        self.passed = 0
+
+    def update(self, dt):
+        """Update the obstacles and delete the ones that ran off the screen."""
+        obstacles = self.obstacles
+
+        # Only the obstacles at the front of the queue can be off the screen
+        while obstacles and obstacles[0].x + obstacles[0].width < 0:
+            obstacles.popleft().delete()
+            self.passed -= 1
+
+        for obstacle in obstacles:
+            obstacle.update(dt)
+
+        # Skip the obstacles that moved past the position
+        while self.passed < len(obstacles) and obstacles[self.passed].x + obstacles[self.passed].width < self.x:
+            self.passed += 1
+
+    def remove_passed(self):
+        """Delete the obstacles that already moved past the position."""
+        for _ in range(self.passed):
+            self.obstacles.popleft().delete()
+
+        self.passed = 0
+
+    def get_next(self):
+        """Get the first obstacle that didn't pass the position yet, if any."""
+        return self.obstacles[self.passed] if self.passed < len(self.obstacles) else None
+
+    def get_range(self, left, right):
+        """Get the obstacles that overlap the horizontal range, before testing them for collisions."""
+        obstacles = []
+
+        for obstacle in self.obstacles:
+            # The obstacles that follow are further to the right
+            if obstacle.x >= right:
+                break
+
+            if obstacle.x + obstacle.width > left:
+                obstacles.append(obstacle)
+
+        return obstacles
@@ -0,0 +1,18 @@
+from .entity import Entity
+import random
+
+
+class Star(Entity):
+    SIZE = (18, 18)
+    IMAGE_COUNT = 3
+
+    def __init__(self, *args, image_index=None, **kwargs):
+        """Create a star. If no image is specified, a random one is chosen."""
+        super().__init__(*args, **kwargs)
+        self.image_index = random.randrange(self.IMAGE_COUNT) if image_index is None else image_index
+        self.opacity = 255
+
+    def update(self, dt, opacity):
+        """Update the star."""
+        self.opacity = opacity
+        super().update(dt)
@@ -0,0 +1,12 @@
+from .entity import Entity
+
+
+class Terrain(Entity):
+    SIZE = (2402, 27)
+
+    def update(self, dt):
+        """Update the terrain."""
+        if self.x + self.width < 0:
+            self.x += 2 * self.width
+
+        super().update(dt)
@@ -13,27 +13,66 @@ in Processing.
 To play the game manually, type in the following command:
     python main.py
 
-To run the game using NEAT, add the argument 'neat' to the command. For example:
-    python main.py neat
+To run the game using NEAT, use the 'train' command. For example:
+    python main.py train
 
-To enable night mode, add the argument 'night' to the command. For example:
-    python main.py night
+To enable night mode, add the option '--night' to the command. For example:
+    python main.py play --night
 
-To enable both NEAT and night mode, add both arguments to the command.
-The order of these arguments do not matter.
+The population size, the number of generations, the seed of the course
+and the NEAT config file of the training are set with options. For example:
+    python main.py train --population 10000 --generations 50 --seed 7
+
+To train the AI without a window (e.g. on a server without a display),
+add the option '--headless' to the command. For example:
+    python main.py train --headless
+
+To train the AI without a window using every CPU core (or '--workers'
+processes), add the option '--parallel' to the command. For example:
+    python main.py train --parallel --workers 8
+
+To train the AI faster than real time while watching it, add the option
+'--turbo' to the command. For example:
+    python main.py train --turbo
+
+To measure the time spent in each phase of the game, add the option
+'--profile' to the command. The timings are shown on the screen and appended
+to chrome_dinosaur_game_neat/profile.jsonl. For example:
+    python main.py train --profile
+
+The training is saved to the 'chrome_dinosaur_game_neat/checkpoints' directory
+after every generation.
+To resume it from the latest checkpoint, add the option '--resume' to the
+command. For example:
+    python main.py train --resume
+
+To train the AI without a window across several machines, start a
+coordinator with the option '--coordinator' and workers (one process per
+core) with the 'worker' command. They connect to '--address' (by default
+COORDINATOR_ADDRESS in constants.py). For example:
+    python main.py train --coordinator
+    python main.py worker
+
+To evolve several populations (islands) with different NEAT settings in
+parallel, exchanging their fittest genomes every few generations, add the
+option '--islands' to the command. For example:
+    python main.py train --islands
+
+To watch the exported winner (or a stored genome) play, use the 'replay'
+command. For example:
+    python main.py replay
+    python main.py replay --genome 42
+
+To benchmark the game without a display, use the 'bench' command. For example:
+    python main.py bench --sizes 100 1000
+
+Every command lists its options with '--help'.
 '''
 
 # Imported modules
-import chrome_dinosaur_game_neat
-from sys import argv
+from chrome_dinosaur_game_neat.cli import main
 
 
 if __name__ == "__main__":
-    # Check if the user has enabled or disabled the NEAT implementation
-    enable_neat = ("neat" in argv)
-
-    # Check if the user has enabled night mode
-    night_mode = ("night" in argv)
-
-    # Run the game
-    chrome_dinosaur_game_neat.run(enable_neat=enable_neat, night_mode=night_mode)
+    # Run the command given on the command line
+    main()
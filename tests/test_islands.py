@@ -0,0 +1,20 @@
+from chrome_dinosaur_game_neat.libs.neat import IslandModel
+
+
+def count_genes(genomes, config, seed):
+    """Reward the genomes for their size, so that they grow hidden nodes quickly."""
+    return [float(len(genome.nodes) + len(genome.connections)) for genome in genomes]
+
+
+def test_migrants_keep_evolving_on_other_islands():
+    # Every generation, the fittest genomes of each island join the other one, where they are mutated
+    # along with their offspring. One island adds nodes much faster, so its migrants have nodes
+    # numbered beyond the other island's.
+    settings = {"pop_size": 30, "conn_add_prob": 0.5, "no_fitness_termination": True}
+    islands = [({**settings, "node_add_prob": 0.9}, 1), ({**settings, "node_add_prob": 0.1}, 2)]
+    model = IslandModel(count_genes, islands, interval=1, migrants=5)
+    generations = []
+    winner = model.run(40, on_generation=lambda island, generation, *_: generations.append((island, generation)))
+
+    assert sorted(generations) == [(island, generation) for island in range(2) for generation in range(40)]
+    assert winner.fitness > 0
@@ -0,0 +1,31 @@
+from chrome_dinosaur_game_neat.benchmark import create_genomes
+from chrome_dinosaur_game_neat.libs.neat import BatchFeedForwardNetwork, load_config
+from chrome_dinosaur_game_neat.libs.policy import Policy
+from neat.nn import FeedForwardNetwork
+import numpy as np
+
+
+def test_batch_matches_neat_networks():
+    config = load_config()
+    genomes = create_genomes(config, 50, 0, mutations=20)
+    inputs = np.random.default_rng(0).uniform(-500, 500, (len(genomes), 6))
+    outputs = BatchFeedForwardNetwork.create(genomes, config).activate(inputs)
+
+    for genome, row, output in zip(genomes, inputs, outputs):
+        expected = FeedForwardNetwork.create(genome, config).activate(row.tolist())
+        np.testing.assert_allclose(output, expected, rtol=0, atol=1e-12)
+
+
+def test_policy_round_trip(tmp_path):
+    config = load_config()
+    genomes = create_genomes(config, 20, 1, mutations=20)
+    inputs = np.random.default_rng(1).uniform(-500, 500, (len(genomes), 6))
+    policy = BatchFeedForwardNetwork.create(genomes, config)
+    path = tmp_path / "policy.npz"
+    policy.save(path)
+    loaded = Policy.load(path)
+
+    assert type(loaded) is Policy
+    assert len(loaded) == len(genomes)
+    np.testing.assert_array_equal(loaded.activate(inputs), policy.activate(inputs))
+    np.testing.assert_array_equal(loaded.subset([3]).activate(inputs[3:4]), policy.activate(inputs)[3:4])
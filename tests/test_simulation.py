@@ -0,0 +1,29 @@
+from chrome_dinosaur_game_neat.benchmark import create_genomes
+from chrome_dinosaur_game_neat.event_handlers import NEATEventHandler
+from chrome_dinosaur_game_neat.libs.neat import load_config
+import copy
+import numpy as np
+import pytest
+
+
+def simulate(genomes, config, seed, event_driven, substep, decision_steps):
+    """Play a generation on the course of the seed without a window and get the fitness values."""
+    genomes = copy.deepcopy(genomes)
+    game = NEATEventHandler(headless=True, event_driven=event_driven, decision_steps=decision_steps)
+    game.substep = substep
+    game.simulate(genomes, config, seed)
+    return np.array([genome.fitness for genome in genomes])
+
+
+@pytest.mark.parametrize("substep", [1 / 60, 1 / 120, 0.025])
+@pytest.mark.parametrize("decision_steps", [1, 3])
+def test_skipping_matches_stepping(substep, decision_steps):
+    config = load_config()
+    genomes = create_genomes(config, 300, 0)
+
+    for seed in range(3):
+        stepped = simulate(genomes, config, seed, False, substep, decision_steps)
+        skipped = simulate(genomes, config, seed, True, substep, decision_steps)
+
+        # The skipped steps are worked out at once, which only changes the rounding
+        np.testing.assert_allclose(skipped, stepped, rtol=0, atol=1e-9)
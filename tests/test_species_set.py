@@ -0,0 +1,47 @@
+from chrome_dinosaur_game_neat.libs.neat import Population
+from chrome_dinosaur_game_neat.libs.species_set import SpeciesSet
+from neat import DefaultSpeciesSet
+from itertools import count
+import copy
+import random
+
+
+def get_members(species_set):
+    """Get the keys of the members of every species."""
+    return {key: sorted(species.members) for key, species in species_set.species.items()}
+
+
+def test_species_match_default_species_set():
+    random.seed(7)
+    population = Population(overrides={"pop_size": 100, "compatibility_threshold": 2.5}, verbose=False)
+    species_set = population.species
+    speciate = species_set.speciate
+    fitness = random.Random(1)
+    assert isinstance(species_set, SpeciesSet)
+
+    def compare(config, genomes, generation):
+        """Speciate the genomes with both species sets, starting from the same species."""
+        reference = DefaultSpeciesSet(species_set.species_set_config, species_set.reporters)
+        reference.species = copy.deepcopy(species_set.species)
+
+        # Both species sets number the new species from the same key
+        next_key = next(species_set.indexer)
+        species_set.indexer = count(next_key)
+        reference.indexer = count(next_key)
+
+        reference.speciate(config, copy.deepcopy(genomes), generation)
+        speciate(config, genomes, generation)
+
+        assert species_set.genome_to_species == reference.genome_to_species
+        assert get_members(species_set) == get_members(reference)
+
+    species_set.speciate = compare
+
+    for _ in range(4):
+        for genome in population.population.values():
+            genome.fitness = fitness.uniform(0, 10)
+
+        population.end_generation()
+
+    # Some genomes share species, and some don't
+    assert 1 < len(species_set.species) < len(population.population)